@@ -0,0 +1,149 @@
+"""
+Análises de toda a carteira com NumPy: as colunas dos históricos de todas
+as contas são exportadas uma única vez para arrays e os agregados são
+calculados com operações vetorizadas de agrupamento (bincount/unique).
+
+Depende de numpy, que o restante do desafio não exige.
+
+Uso: python analitico.py [contas] [transacoes_por_conta]
+"""
+import sys
+import time
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Tuple, Union
+
+import numpy as np
+
+from desafio_v4 import Conta, Dinheiro, Historico
+
+_SEGUNDOS_DIA = 86_400
+
+
+class CarteiraAnalitica:
+    """
+    Fotografia colunar das transações de várias contas:
+
+    - conta: índice da conta (posição em `numeros`) de cada transação;
+    - tipo: código do tipo, como em Historico;
+    - valor: centavos;
+    - dia: dias desde a época no fuso horário local, como date.fromtimestamp.
+
+    Alterações posteriores nas contas não se refletem na fotografia.
+    """
+
+    def __init__(self: object, contas: Iterable[Conta]) -> None:
+        numeros, tipos, valores, datas = [], [], [], []
+        for conta in contas:
+            colunas = conta.historico.exportar_colunas()
+            numeros.append(conta.numero)
+            tipos.append(np.frombuffer(colunas[0], dtype=np.uint8))
+            valores.append(np.frombuffer(colunas[1], dtype=np.int64))
+            datas.append(np.frombuffer(colunas[2], dtype=np.int64))
+
+        self.numeros = np.array(numeros, dtype=np.int64)
+        quantidades = np.array([len(tipo) for tipo in tipos], dtype=np.int64)
+        self.conta = np.repeat(np.arange(len(numeros)), quantidades)
+        self.tipo = np.concatenate(tipos) if tipos else np.empty(0, dtype=np.uint8)
+        self.valor = np.concatenate(valores) if valores else np.empty(0, dtype=np.int64)
+        segundos = np.concatenate(datas) if datas else np.empty(0, dtype=np.int64)
+
+        # O deslocamento do fuso é o atual: suficiente para fusos sem horário de verão.
+        deslocamento = int(datetime.now().astimezone().utcoffset().total_seconds())
+        self.dia = (segundos + deslocamento) // _SEGUNDOS_DIA
+
+    def __len__(self: object) -> int:
+        return len(self.valor)
+
+    def _mascara(self: object, tipo: str) -> np.ndarray:
+        codigo = Historico._codigos_tipo.get(tipo)
+        return self.tipo == codigo if codigo is not None else np.zeros(len(self.tipo), dtype=bool)
+
+    def volume_por_dia(self: object, tipo: Union[str, None] = None) -> List[Tuple[date, Dinheiro]]:
+        """Soma dos valores por dia, em ordem cronológica, de todas as transações ou de um tipo."""
+        dias, valores = self.dia, self.valor
+        if tipo is not None:
+            mascara = self._mascara(tipo)
+            dias, valores = dias[mascara], valores[mascara]
+
+        unicos, grupos = np.unique(dias, return_inverse=True)
+        totais = np.bincount(grupos, weights=valores, minlength=len(unicos))
+        return [
+            (date.fromordinal(date(1970, 1, 1).toordinal() + int(dia)), Dinheiro(int(round(total))))
+            for dia, total in zip(unicos, totais)
+        ]
+
+    def maiores_saidas(self: object, quantidade: int = 10) -> List[Tuple[int, Dinheiro]]:
+        """As `quantidade` contas com maior total sacado, como (numero, total)."""
+        mascara = self._mascara("Saque")
+        totais = np.bincount(self.conta[mascara], weights=self.valor[mascara], minlength=len(self.numeros))
+        quantidade = min(quantidade, len(totais))
+        if not quantidade:
+            return []
+
+        candidatas = np.argpartition(-totais, quantidade - 1)[:quantidade]
+        ordem = candidatas[np.lexsort((self.numeros[candidatas], -totais[candidatas]))]
+        return [(int(self.numeros[indice]), Dinheiro(int(round(totais[indice])))) for indice in ordem]
+
+    def ticket_medio_por_tipo(self: object) -> Dict[str, Dinheiro]:
+        """Valor médio por tipo de transação, arredondado para o centavo."""
+        quantidades = np.bincount(self.tipo, minlength=len(Historico._tipos_conhecidos))
+        totais = np.bincount(self.tipo, weights=self.valor, minlength=len(quantidades))
+        return {
+            Historico._tipos_conhecidos[codigo]: Dinheiro(int(round(totais[codigo] / quantidades[codigo])))
+            for codigo in np.flatnonzero(quantidades)
+        }
+
+
+def _maiores_saidas_com_lacos(contas: List[Conta], quantidade: int = 10) -> List[Tuple[int, Dinheiro]]:
+    """Versão com laços sobre Historico.transacoes, usada como referência no benchmark."""
+    totais = {}
+    for conta in contas:
+        for transacao in conta.historico.transacoes:
+            if transacao["tipo"] == "Saque":
+                totais[conta.numero] = totais.get(conta.numero, Dinheiro()) + transacao["valor"]
+    return sorted(totais.items(), key=lambda item: (-item[1].centavos, item[0]))[:quantidade]
+
+
+def main() -> None:
+    """Compara a análise vetorizada com os laços sobre os dicionários do histórico."""
+    import random
+
+    from desafio_v4 import ContaCorrente, PessoaFisica
+
+    total_contas = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    por_conta = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    aleatorio = random.Random(42)
+    inicio_periodo = int(time.time()) - _SEGUNDOS_DIA * 365
+
+    contas = []
+    for numero in range(1, total_contas + 1):
+        conta = ContaCorrente(numero, PessoaFisica("Cliente", "", f"{numero:011d}", ""))
+        datas = sorted(aleatorio.randrange(inicio_periodo, inicio_periodo + _SEGUNDOS_DIA * 365)
+                       for _ in range(por_conta))
+        for data in datas:
+            tipo = "Saque" if aleatorio.random() < 0.4 else "Depósito"
+            conta.historico.restaurar_transacao(tipo, aleatorio.randint(100, 100_000), data)
+        contas.append(conta)
+
+    inicio = time.perf_counter()
+    esperado = _maiores_saidas_com_lacos(contas)
+    com_lacos = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    carteira = CarteiraAnalitica(contas)
+    exportacao = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    obtido = carteira.maiores_saidas()
+    carteira.volume_por_dia()
+    carteira.ticket_medio_por_tipo()
+    vetorizado = time.perf_counter() - inicio
+
+    assert obtido == esperado, "A análise vetorizada divergiu da referência!"
+    print(f"{len(carteira)} transações em {total_contas} contas")
+    print(f"laços (só maiores saídas): {com_lacos * 1000:>9.1f} ms")
+    print(f"exportação para arrays:    {exportacao * 1000:>9.1f} ms")
+    print(f"vetorizado (3 análises):   {vetorizado * 1000:>9.1f} ms ({com_lacos / vetorizado:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
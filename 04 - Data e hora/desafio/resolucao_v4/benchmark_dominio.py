@@ -0,0 +1,267 @@
+"""
+Benchmark do domínio bancário com cargas sintéticas determinísticas.
+
+A mesma semente gera sempre os mesmos clientes, contas e operações, então
+duas execuções (por exemplo, antes e depois de uma mudança) podem ser
+comparadas diretamente com --json e --comparar. Cada cenário informa
+operações por segundo, latências p50/p99 e o pico de memória alocada
+durante a execução.
+
+Uso:
+    python benchmark_dominio.py [--semente 42] [--clientes 10000] [--operacoes 100000]
+                                [--cenarios misto,extrato] [--json atual.json] [--comparar anterior.json]
+"""
+import argparse
+import json
+import random
+import time
+import tracemalloc
+from typing import Callable, Dict, List, NamedTuple, Tuple, Union
+
+from desafio_v4 import ContaCorrente, Deposito, Dinheiro, MotorTransferencias, PessoaFisica, RegistroClientes, Saque
+
+Operacao = Tuple
+
+NOMES = ["Ana", "Bruno", "Carla", "Diego", "Elisa", "Fábio", "Gabriela", "Heitor", "Isabela", "João"]
+SOBRENOMES = ["Silva", "Santos", "Oliveira", "Souza", "Lima", "Pereira", "Costa", "Almeida"]
+
+
+class Carga(NamedTuple):
+    """
+    clientes: (nome, data de nascimento, cpf, endereço, quantidade de contas);
+    operacoes: ("Depósito" | "Saque", numero, centavos) ou
+    ("Transferência", origem, destino, centavos), como em LivroParticionado.
+    """
+
+    clientes: List[Tuple[str, str, str, str, int]]
+    operacoes: List[Operacao]
+
+
+class Cenario(NamedTuple):
+    """`preparar` monta o estado fora da medição; `executar` retorna (latências em ns, aceitas)."""
+
+    preparar: Callable[[Carga, RegistroClientes], None]
+    executar: Callable[[Carga, RegistroClientes], Tuple[List[int], int]]
+
+
+class Medicao(NamedTuple):
+    operacoes: int
+    aceitas: int
+    segundos: float
+    p50_us: float
+    p99_us: float
+    pico_memoria: int
+
+    @property
+    def operacoes_por_segundo(self: object) -> float:
+        return self.operacoes / self.segundos if self.segundos else 0.0
+
+
+def gerar_carga(
+    semente: int = 42,
+    total_clientes: int = 10_000,
+    total_operacoes: int = 100_000,
+    proporcao_saques: float = 0.3,
+    proporcao_transferencias: float = 0.1,
+) -> Carga:
+    """
+    Gera uma carga reprodutível:
+
+    - cada cliente tem 1 conta (80%), 2 (15%) ou 3 (5%);
+    - a atividade por conta segue uma distribuição de Pareto: poucas
+      contas concentram a maior parte das operações;
+    - os valores seguem uma log-normal, com mediana de R$ 150 nos
+      depósitos e de R$ 80 nos saques e transferências.
+    """
+    aleatorio = random.Random(semente)
+    clientes = []
+    for indice in range(1, total_clientes + 1):
+        nome = f"{aleatorio.choice(NOMES)} {aleatorio.choice(SOBRENOMES)}"
+        nascimento = f"{aleatorio.randint(1, 28):02d}-{aleatorio.randint(1, 12):02d}-{aleatorio.randint(1940, 2006)}"
+        endereco = f"Rua {aleatorio.randint(1, 500)}, {aleatorio.randint(1, 999)}"
+        quantidade_contas = aleatorio.choices((1, 2, 3), weights=(80, 15, 5))[0]
+        clientes.append((nome, nascimento, f"{indice:011d}", endereco, quantidade_contas))
+
+    total_contas = sum(cliente[4] for cliente in clientes)
+    pesos = [aleatorio.paretovariate(1.2) for _ in range(total_contas)]
+    numeros = aleatorio.choices(range(1, total_contas + 1), weights=pesos, k=total_operacoes)
+
+    def centavos(mediana: int) -> int:
+        return max(1, round(aleatorio.lognormvariate(0, 1) * mediana * 100))
+
+    operacoes: List[Operacao] = []
+    for numero in numeros:
+        sorteio = aleatorio.random()
+        if sorteio < proporcao_transferencias and total_contas > 1:
+            destino = aleatorio.randint(1, total_contas - 1)
+            destino += destino >= numero
+            operacoes.append(("Transferência", numero, destino, centavos(80)))
+        elif sorteio < proporcao_transferencias + proporcao_saques:
+            operacoes.append(("Saque", numero, centavos(80)))
+        else:
+            operacoes.append(("Depósito", numero, centavos(150)))
+    return Carga(clientes, operacoes)
+
+
+def abrir_contas(carga: Carga, registro: RegistroClientes) -> Tuple[List[int], int]:
+    """
+    Cadastra os clientes e contas da carga, medindo cada cliente. Os
+    limites diários e de saques são ampliados para que os cenários seguintes
+    meçam o processamento das operações, não as recusas por limite.
+    """
+    latencias = []
+    relogio = time.perf_counter_ns
+    numero = 0
+    for nome, nascimento, cpf, endereco, quantidade_contas in carga.clientes:
+        inicio = relogio()
+        cliente = PessoaFisica(nome, nascimento, cpf, endereco)
+        cliente.limite_transacoes_diarias = cliente.limite_transferencias_diarias = 10**9
+        registro.adicionar(cliente)
+        for _ in range(quantidade_contas):
+            numero += 1
+            conta = ContaCorrente(numero, cliente, limite=10_000, limite_saques=10**9)
+            registro.registrar_conta(conta)
+        latencias.append(relogio() - inicio)
+    return latencias, len(latencias)
+
+
+def executar_operacoes(registro: RegistroClientes, operacoes: List[Operacao]) -> Tuple[List[int], int]:
+    """Aplica as operações pelas classes de domínio, medindo cada uma."""
+    motor = MotorTransferencias()
+    latencias = []
+    aceitas = 0
+    relogio = time.perf_counter_ns
+    for operacao in operacoes:
+        inicio = relogio()
+        if operacao[0] == "Transferência":
+            _, origem, destino, centavos = operacao
+            conta_origem, conta_destino = registro.buscar_conta(origem), registro.buscar_conta(destino)
+            resultado = motor.transferir(conta_origem, conta_destino, Dinheiro(centavos))
+        else:
+            tipo, numero, centavos = operacao
+            conta = registro.buscar_conta(numero)
+            transacao = Saque(Dinheiro(centavos)) if tipo == "Saque" else Deposito(Dinheiro(centavos))
+            resultado = conta.cliente.realizar_transacao(conta, transacao)
+        latencias.append(relogio() - inicio)
+        aceitas += bool(resultado)
+    return latencias, aceitas
+
+
+def gerar_extratos(carga: Carga, registro: RegistroClientes) -> Tuple[List[int], int]:
+    """Gera a primeira página (50 linhas) do extrato de cada conta movimentada."""
+    latencias = []
+    relogio = time.perf_counter_ns
+    for numero in sorted({operacao[1] for operacao in carga.operacoes}):
+        historico = registro.buscar_conta(numero).historico
+        inicio = relogio()
+        for _ in historico.gerar_relatorio(limite=50):
+            pass
+        latencias.append(relogio() - inicio)
+    return latencias, len(latencias)
+
+
+def _preparar_contas(carga: Carga, registro: RegistroClientes) -> None:
+    abrir_contas(carga, registro)
+
+
+def _preparar_com_saldo(carga: Carga, registro: RegistroClientes) -> None:
+    abrir_contas(carga, registro)
+    for conta in registro.cursor_contas().contas():
+        conta.depositar(Dinheiro(10_000_000))
+
+
+def _preparar_historico(carga: Carga, registro: RegistroClientes) -> None:
+    _preparar_com_saldo(carga, registro)
+    executar_operacoes(registro, carga.operacoes)
+
+
+def _somente(tipo: str) -> Callable[[Carga, RegistroClientes], Tuple[List[int], int]]:
+    def executar(carga: Carga, registro: RegistroClientes) -> Tuple[List[int], int]:
+        return executar_operacoes(registro, [operacao for operacao in carga.operacoes if operacao[0] == tipo])
+
+    return executar
+
+
+CENARIOS: Dict[str, Cenario] = {
+    "abertura": Cenario(lambda carga, registro: None, abrir_contas),
+    "depositos": Cenario(_preparar_contas, _somente("Depósito")),
+    "saques": Cenario(_preparar_com_saldo, _somente("Saque")),
+    "transferencias": Cenario(_preparar_com_saldo, _somente("Transferência")),
+    "misto": Cenario(_preparar_com_saldo, lambda carga, registro: executar_operacoes(registro, carga.operacoes)),
+    "extrato": Cenario(_preparar_historico, gerar_extratos),
+}
+
+
+def _percentil(ordenadas: List[int], fracao: float) -> float:
+    if not ordenadas:
+        return 0.0
+    return ordenadas[min(len(ordenadas) - 1, int(fracao * len(ordenadas)))] / 1000
+
+
+def medir(cenario: Cenario, carga: Carga) -> Medicao:
+    """
+    Executa o cenário duas vezes sobre registros novos: uma cronometrada e
+    outra sob tracemalloc, que distorceria o tempo, para obter o pico de memória.
+    """
+    registro = RegistroClientes()
+    cenario.preparar(carga, registro)
+    inicio = time.perf_counter()
+    latencias, aceitas = cenario.executar(carga, registro)
+    segundos = time.perf_counter() - inicio
+
+    registro = RegistroClientes()
+    cenario.preparar(carga, registro)
+    tracemalloc.start()
+    cenario.executar(carga, registro)
+    pico = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    latencias.sort()
+    return Medicao(len(latencias), aceitas, segundos, _percentil(latencias, 0.5), _percentil(latencias, 0.99), pico)
+
+
+def _coluna(atual: float, anterior: Union[float, None], formato: str) -> str:
+    """Formata o valor atual seguido da variação em relação à execução anterior, se houver."""
+    variacao = f"({(atual - anterior) / anterior:+.0%})" if anterior else ""
+    return f"{format(atual, formato)} {variacao:>7}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark do domínio bancário com cargas sintéticas.")
+    parser.add_argument("--semente", type=int, default=42)
+    parser.add_argument("--clientes", type=int, default=10_000)
+    parser.add_argument("--operacoes", type=int, default=100_000)
+    parser.add_argument("--cenarios", default=",".join(CENARIOS), help="lista separada por vírgulas")
+    parser.add_argument("--json", help="grava os resultados neste arquivo")
+    parser.add_argument("--comparar", help="arquivo JSON de uma execução anterior para comparação")
+    argumentos = parser.parse_args()
+
+    carga = gerar_carga(argumentos.semente, argumentos.clientes, argumentos.operacoes)
+    anteriores = {}
+    if argumentos.comparar:
+        with open(argumentos.comparar, encoding="utf-8") as arquivo:
+            anteriores = json.load(arquivo)["cenarios"]
+
+    resultados = {}
+    print(f"{'cenário':<15} {'operações':>10} {'aceitas':>10} {'ops/s':>18} {'p50 µs':>16} {'p99 µs':>16} "
+          f"{'pico KiB':>16}")
+    for nome in argumentos.cenarios.split(","):
+        medicao = medir(CENARIOS[nome], carga)
+        anterior = anteriores.get(nome, {})
+        resultados[nome] = {**medicao._asdict(), "operacoes_por_segundo": medicao.operacoes_por_segundo}
+        colunas = [
+            _coluna(medicao.operacoes_por_segundo, anterior.get("operacoes_por_segundo"), ">10.0f"),
+            _coluna(medicao.p50_us, anterior.get("p50_us"), ">8.1f"),
+            _coluna(medicao.p99_us, anterior.get("p99_us"), ">8.1f"),
+            _coluna(medicao.pico_memoria / 1024, anterior.get("pico_memoria", 0) / 1024, ">8.0f"),
+        ]
+        print((f"{nome:<15} {medicao.operacoes:>10} {medicao.aceitas:>10} " + " ".join(colunas)).rstrip())
+
+    if argumentos.json:
+        with open(argumentos.json, "w", encoding="utf-8") as arquivo:
+            json.dump({"semente": argumentos.semente, "clientes": argumentos.clientes,
+                       "operacoes": argumentos.operacoes, "cenarios": resultados}, arquivo, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Mede a memória residente por conta (cliente + conta corrente + histórico
+vazio) e por transação de saque/depósito, usando tracemalloc.
+
+Uso: python benchmark_memoria.py [contas]
+"""
+import sys
+import tracemalloc
+
+from desafio_v4 import ContaCorrente, Deposito, PessoaFisica, Saque
+
+
+def medir(funcao, quantidade: int) -> float:
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+    objetos = funcao(quantidade)
+    depois = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objetos
+    return (depois - antes) / quantidade
+
+
+def criar_contas(quantidade: int) -> list:
+    contas = []
+    for numero in range(quantidade):
+        cliente = PessoaFisica("Cliente", "01-01-2000", f"{numero:011d}", "Endereço")
+        conta = ContaCorrente(numero, cliente)
+        cliente.adicionar_conta(conta)
+        contas.append(conta)
+    return contas
+
+
+def criar_transacoes(quantidade: int) -> list:
+    return [Saque(10) if numero % 2 else Deposito(10) for numero in range(quantidade)]
+
+
+def main() -> None:
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"Bytes por conta:     {medir(criar_contas, quantidade):>8.0f}")
+    print(f"Bytes por transação: {medir(criar_transacoes, quantidade):>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
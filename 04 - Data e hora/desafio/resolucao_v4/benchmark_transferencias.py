@@ -0,0 +1,54 @@
+"""
+Mede a vazão (transferências por segundo) do MotorTransferencias em
+função do número de threads.
+
+Uso: python benchmark_transferencias.py [contas] [transferencias]
+"""
+import random
+import sys
+import time
+
+from desafio_v4 import ContaCorrente, Dinheiro, MotorTransferencias, PessoaFisica
+
+
+def criar_contas(quantidade: int) -> list:
+    contas = []
+    for numero in range(1, quantidade + 1):
+        cliente = PessoaFisica("Cliente", "01-01-2000", f"{numero:011d}", "Endereço")
+        conta = ContaCorrente(numero, cliente, limite=10_000, limite_saques=10**9)
+        conta.depositar(Dinheiro(1_000_000))
+        contas.append(conta)
+    return contas
+
+
+def gerar_transferencias(contas: list, quantidade: int, semente: int = 42) -> list:
+    aleatorio = random.Random(semente)
+    transferencias = []
+    for _ in range(quantidade):
+        origem, destino = aleatorio.sample(contas, 2)
+        transferencias.append((origem, destino, Dinheiro(aleatorio.randint(1, 50_000))))
+    return transferencias
+
+
+def main() -> None:
+    total_contas = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000
+    total_transferencias = int(sys.argv[2]) if len(sys.argv) > 2 else 100_000
+
+    print(f"{'threads':>8} {'transf/s':>12} {'aceitas':>9} {'saldo total':>16}")
+    for threads in (1, 2, 4, 8, 16):
+        contas = criar_contas(total_contas)
+        transferencias = gerar_transferencias(contas, total_transferencias)
+        saldo_inicial = sum(conta.saldo.centavos for conta in contas)
+
+        inicio = time.perf_counter()
+        resultados = MotorTransferencias().executar(transferencias, threads=threads)
+        duracao = time.perf_counter() - inicio
+
+        saldo_final = sum(conta.saldo.centavos for conta in contas)
+        assert saldo_final == saldo_inicial, "O saldo total do banco não foi preservado!"
+        aceitas = sum(1 for resultado in resultados if resultado)
+        print(f"{threads:>8} {total_transferencias / duracao:>12.0f} {aceitas:>9} {Dinheiro(saldo_final):>16,.2f}")
+
+
+if __name__ == "__main__":
+    main()
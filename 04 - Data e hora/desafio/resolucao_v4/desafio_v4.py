@@ -1,40 +1,571 @@
+import bisect
+import calendar
+import functools
+import itertools
+import sys
+import threading
 import textwrap
 from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import List, Union, Generator
+from array import array
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+from pathlib import Path
+from enum import IntEnum
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, TextIO, Tuple, Union, Generator
 import re
 
+from metricas import Metricas
+from persistencia import Armazenamento
 
-class ContasIterador:
+ROOT_PATH = Path(__file__).parent
+
+
+class Dinheiro:
+    """
+    Valor monetário de ponto fixo, armazenado como inteiro de centavos.
+    Soma, subtração e comparação são operações inteiras, sem o acúmulo
+    de erros de arredondamento de float.
+    """
+
+    __slots__ = ("_centavos",)
+
+    # Maior valor absoluto de uma transação: as colunas array("q") do Historico são inteiros de 64 bits.
+    MAXIMO_CENTAVOS = 2**63 - 1
+
+    def __init__(self: object, centavos: int = 0) -> None:
+        self._centavos: int = centavos
+
+    @classmethod
+    def de_reais(cls, valor: Union['Dinheiro', int, float, str, Decimal]) -> 'Dinheiro':
+        """
+        Converte um valor em reais (número ou texto) para Dinheiro, arredondando ao centavo.
+        Valores acima de MAXIMO_CENTAVOS levantam ValueError.
+        """
+        if isinstance(valor, Dinheiro):
+            return valor
+        if isinstance(valor, bool) or not isinstance(valor, (int, float, str, Decimal)):
+            raise TypeError(f"Valor monetário inválido: {valor!r}")
+        try:
+            reais = Decimal(str(valor).strip().replace(",", "."))
+        except InvalidOperation:
+            raise ValueError(f"Valor monetário inválido: {valor!r}") from None
+        if not reais.is_finite():
+            raise ValueError(f"Valor monetário inválido: {valor!r}")
+        centavos = int((reais * 100).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+        if abs(centavos) > cls.MAXIMO_CENTAVOS:
+            raise ValueError(f"Valor monetário fora do limite: {valor!r}")
+        return cls(centavos)
+
+    @property
+    def centavos(self: object) -> int:
+        return self._centavos
+
+    def __add__(self: object, outro: 'Dinheiro') -> 'Dinheiro':
+        if not isinstance(outro, Dinheiro):
+            return NotImplemented
+        return Dinheiro(self._centavos + outro._centavos)
+
+    def __sub__(self: object, outro: 'Dinheiro') -> 'Dinheiro':
+        if not isinstance(outro, Dinheiro):
+            return NotImplemented
+        return Dinheiro(self._centavos - outro._centavos)
+
+    def __neg__(self: object) -> 'Dinheiro':
+        return Dinheiro(-self._centavos)
+
+    def __eq__(self: object, outro: object) -> bool:
+        if isinstance(outro, Dinheiro):
+            return self._centavos == outro._centavos
+        return NotImplemented
+
+    def __lt__(self: object, outro: 'Dinheiro') -> bool:
+        if not isinstance(outro, Dinheiro):
+            return NotImplemented
+        return self._centavos < outro._centavos
+
+    def __le__(self: object, outro: 'Dinheiro') -> bool:
+        if not isinstance(outro, Dinheiro):
+            return NotImplemented
+        return self._centavos <= outro._centavos
+
+    def __gt__(self: object, outro: 'Dinheiro') -> bool:
+        if not isinstance(outro, Dinheiro):
+            return NotImplemented
+        return self._centavos > outro._centavos
+
+    def __ge__(self: object, outro: 'Dinheiro') -> bool:
+        if not isinstance(outro, Dinheiro):
+            return NotImplemented
+        return self._centavos >= outro._centavos
+
+    def __hash__(self: object) -> int:
+        return hash(self._centavos)
+
+    def __bool__(self: object) -> bool:
+        return self._centavos != 0
+
+    def __float__(self: object) -> float:
+        return self._centavos / 100
+
+    def __format__(self: object, especificacao: str) -> str:
+        return format(self._centavos / 100, especificacao or ".2f")
+
+    def __str__(self: object) -> str:
+        return f"{self:.2f}"
+
+    def __repr__(self: object) -> str:
+        return f"Dinheiro('{self:.2f}')"
+
+
+class Resultado(IntEnum):
     """
-    Implementa um iterador para percorrer as contas de forma sequencial.
+    Resultado de uma operação do domínio. Apenas ACEITA é verdadeiro em
+    contexto booleano, de modo que `if conta.sacar(valor):` continua válido.
     """
 
-    def __init__(self: object, contas: List['Conta']) -> None:
-        if not isinstance(contas, list):
-            raise TypeError("O parâmetro 'contas' deve ser uma lista.")
-        self.contas = contas
-        self._index = 0
+    ACEITA = 0
+    VALOR_INVALIDO = 1
+    SALDO_INSUFICIENTE = 2
+    EXCEDEU_LIMITE_SAQUE = 3
+    EXCEDEU_NUMERO_SAQUES = 4
+    EXCEDEU_TRANSACOES_DIA = 5
+    EXCEDEU_TRANSFERENCIAS_DIA = 6
+    TRANSACAO_DUPLICADA = 7
+    CONTA_INEXISTENTE = 8
+    TIPO_INVALIDO = 9
+    MESMA_CONTA = 10
+    DATA_FORA_DE_ORDEM = 11
+    DATA_FUTURA = 12
+
+    def __bool__(self: object) -> bool:
+        return self is Resultado.ACEITA
+
+    @property
+    def mensagem(self: object) -> str:
+        return _MENSAGENS_RESULTADO[self]
+
+
+_MENSAGENS_RESULTADO = {
+    Resultado.ACEITA: "\n=== Transação realizada com sucesso! ===",
+    Resultado.VALOR_INVALIDO: "\n@@@ Operação falhou! O valor informado é inválido. @@@",
+    Resultado.SALDO_INSUFICIENTE: "\n@@@ Operação falhou! Você não tem saldo suficiente. @@@",
+    Resultado.EXCEDEU_LIMITE_SAQUE: "\n@@@ Operação falhou! O valor do saque excede o limite. @@@",
+    Resultado.EXCEDEU_NUMERO_SAQUES: "\n@@@ Operação falhou! Número máximo de saques excedido. @@@",
+    Resultado.EXCEDEU_TRANSACOES_DIA: "\n@@@ Você excedeu o número de transações permitidas para hoje! @@@",
+    Resultado.EXCEDEU_TRANSFERENCIAS_DIA: "\n@@@ Você excedeu o número de transferências permitidas para hoje! @@@",
+    Resultado.TRANSACAO_DUPLICADA: "Transação duplicada detectada, não adicionada.",
+    Resultado.CONTA_INEXISTENTE: "\n@@@ Conta não encontrada! @@@",
+    Resultado.TIPO_INVALIDO: "\n@@@ Tipo de transação inválido! @@@",
+    Resultado.MESMA_CONTA: "\n@@@ As contas de origem e destino devem ser diferentes! @@@",
+    Resultado.DATA_FORA_DE_ORDEM: "\n@@@ A data da transação é anterior à última do histórico! @@@",
+    Resultado.DATA_FUTURA: "\n@@@ A data da transação é posterior ao momento atual! @@@",
+}
+
+
+class Evento(NamedTuple):
+    """Notificação emitida ao final de cada transação realizada por um cliente."""
+
+    operacao: str
+    conta: 'Conta'
+    valor: Dinheiro
+    resultado: Resultado
+
+
+class Eventos:
+    """
+    Canal de eventos do domínio. Sem ouvintes inscritos, emitir não faz
+    nada, então chamadas programáticas não pagam custo de E/S.
+    """
+
+    def __init__(self: object) -> None:
+        self._ouvintes: List[Callable[[Evento], None]] = []
+
+    def inscrever(self: object, ouvinte: Callable[[Evento], None]) -> None:
+        self._ouvintes.append(ouvinte)
 
-    def __iter__(self: object) -> 'ContasIterador':
-        return self
+    def remover(self: object, ouvinte: Callable[[Evento], None]) -> None:
+        self._ouvintes.remove(ouvinte)
 
-    def __next__(self: object) -> str:
-        if self._index >= len(self.contas):
-            raise StopIteration
+    def emitir(self: object, evento: Evento) -> None:
+        for ouvinte in self._ouvintes:
+            ouvinte(evento)
 
-        conta = self.contas[self._index]
-        self._index += 1
+
+eventos = Eventos()
+
+
+def _valor_positivo(valor: Union[Dinheiro, int, float]) -> Union[Dinheiro, None]:
+    """Converte o valor para Dinheiro, retornando None se for inválido, não positivo ou fora do limite."""
+    if not isinstance(valor, (Dinheiro, int, float)) or isinstance(valor, bool):
+        return None
+    try:
+        valor = Dinheiro.de_reais(valor)
+    except ValueError:
+        return None
+    return valor if 0 < valor.centavos <= Dinheiro.MAXIMO_CENTAVOS else None
+
+
+def _segundos(data: Union[datetime, date, int]) -> int:
+    """Converte uma data para segundos desde a época; um `date` vale o início do dia."""
+    if isinstance(data, datetime):
+        return int(data.timestamp())
+    if isinstance(data, date):
+        return int(datetime.combine(data, datetime.min.time()).timestamp())
+    return data
+
+
+class ResumoConta(NamedTuple):
+    """Registro leve de uma conta; o texto só é montado em `formatar`."""
+
+    agencia: str
+    numero: int
+    titular: str
+    saldo: 'Dinheiro'
+
+    def formatar(self: object) -> str:
         return (
-            f"Agência: {conta.agencia}\n"
-            f"Número: {conta.numero}\n"
-            f"Titular: {conta.cliente.nome}\n"
-            f"Saldo: R${conta.saldo:.2f}\n"
+            f"Agência: {self.agencia}\n"
+            f"Número: {self.numero}\n"
+            f"Titular: {self.titular}\n"
+            f"Saldo: R${self.saldo:.2f}\n"
         )
 
-    def reiniciar(self: object) -> None:
-        """Reinicia o índice do iterador para começar do início."""
-        self._index = 0
+
+class CursorContas:
+    """
+    Cursor preguiçoso sobre uma coleção de contas. Cada iteração percorre a
+    coleção de novo, aplicando filtros e fatia sem copiar as contas, e
+    produz um ResumoConta por conta selecionada.
+
+        cursor = registro.cursor_contas().filtrar(saldo_minimo=Dinheiro(10_000))
+        for resumo in cursor.pagina(2, tamanho=20):
+            ...
+    """
+
+    def __init__(
+        self: object,
+        contas: Iterable['Conta'],
+        *,
+        saldo_minimo: Union['Dinheiro', None] = None,
+        agencia: Union[str, None] = None,
+        cpf: Union[str, None] = None,
+        inicio: int = 0,
+        fim: Union[int, None] = None,
+    ) -> None:
+        if iter(contas) is contas:
+            raise TypeError("O parâmetro 'contas' deve ser uma coleção reiterável, não um iterador.")
+        self._contas = contas
+        self._saldo_minimo = saldo_minimo
+        self._agencia = agencia
+        self._cpf = cpf
+        self._inicio = inicio
+        self._fim = fim
+
+    def _copiar(self: object, **alteracoes) -> 'CursorContas':
+        parametros = {
+            "saldo_minimo": self._saldo_minimo,
+            "agencia": self._agencia,
+            "cpf": self._cpf,
+            "inicio": self._inicio,
+            "fim": self._fim,
+        }
+        parametros.update(alteracoes)
+        return CursorContas(self._contas, **parametros)
+
+    def filtrar(
+        self: object,
+        *,
+        saldo_minimo: Union['Dinheiro', None] = None,
+        agencia: Union[str, None] = None,
+        cpf: Union[str, None] = None,
+    ) -> 'CursorContas':
+        """Retorna um novo cursor com os filtros informados somados aos atuais."""
+        if self._inicio or self._fim is not None:
+            raise ValueError("Filtre o cursor antes de fatiá-lo.")
+        if saldo_minimo is not None and self._saldo_minimo is not None:
+            saldo_minimo = max(saldo_minimo, self._saldo_minimo)
+        return self._copiar(
+            saldo_minimo=self._saldo_minimo if saldo_minimo is None else saldo_minimo,
+            agencia=self._agencia if agencia is None else agencia,
+            cpf=self._cpf if cpf is None else cpf,
+        )
+
+    def _selecionadas(self: object) -> Iterator['Conta']:
+        saldo_minimo, agencia, cpf = self._saldo_minimo, self._agencia, self._cpf
+        for conta in self._contas:
+            if saldo_minimo is not None and conta.saldo < saldo_minimo:
+                continue
+            if agencia is not None and conta.agencia != agencia:
+                continue
+            if cpf is not None and conta.cliente.cpf != cpf:
+                continue
+            yield conta
+
+    def contas(self: object) -> Iterator['Conta']:
+        """Percorre as próprias contas selecionadas, sem montar resumos."""
+        return itertools.islice(self._selecionadas(), self._inicio, self._fim)
+
+    def __iter__(self: object) -> Iterator[ResumoConta]:
+        for conta in self.contas():
+            yield ResumoConta(conta.agencia, conta.numero, conta.cliente.nome, conta.saldo)
+
+    def __getitem__(self: object, indice: Union[int, slice]) -> Union[ResumoConta, 'CursorContas']:
+        if isinstance(indice, slice):
+            if indice.step not in (None, 1) or any(
+                limite is not None and limite < 0 for limite in (indice.start, indice.stop)
+            ):
+                raise ValueError("O cursor só aceita fatias com início e fim não negativos e passo 1.")
+            inicio = self._inicio + (indice.start or 0)
+            fim = self._fim
+            if indice.stop is not None:
+                fim = self._inicio + indice.stop if fim is None else min(fim, self._inicio + indice.stop)
+            return self._copiar(inicio=inicio, fim=fim if fim is None else max(fim, inicio))
+
+        if indice < 0:
+            raise IndexError("O cursor não aceita índices negativos.")
+        for resumo in self[indice:indice + 1]:
+            return resumo
+        raise IndexError("Índice fora do cursor.")
+
+    def pagina(self: object, numero: int, tamanho: int = 50) -> 'CursorContas':
+        """Retorna a página `numero` (a partir de 1) com até `tamanho` contas."""
+        if numero < 1 or tamanho < 1:
+            raise ValueError("Página e tamanho devem ser positivos.")
+        return self[(numero - 1) * tamanho:numero * tamanho]
+
+    def contar(self: object) -> int:
+        """Conta as contas selecionadas percorrendo a coleção uma vez."""
+        return sum(1 for _ in self.contas())
+
+    def formatar(self: object) -> Iterator[str]:
+        """Produz o texto de cada conta selecionada, uma por vez."""
+        for resumo in self:
+            yield resumo.formatar()
+
+
+class RegistroClientes:
+    """
+    Cadastro de clientes indexado por CPF, com índices secundários
+    por prefixo de nome e por número de conta. O índice de nomes é
+    ordenado sob demanda, na busca seguinte a novos cadastros, para que
+    cargas em massa e a restauração façam uma única ordenação.
+    """
+
+    def __init__(self: object) -> None:
+        self._por_cpf: Dict[str, 'PessoaFisica'] = {}
+        self._por_nome: List[Tuple[str, str]] = []
+        self._por_nome_ordenado: bool = True
+        self._contas: Dict[int, 'Conta'] = {}
+        self._armazenamento: Union[Armazenamento, None] = None
+        self._persistido: Dict[int, Tuple[int, Dinheiro]] = {}
+
+    def __len__(self: object) -> int:
+        return len(self._por_cpf)
+
+    def __iter__(self: object) -> Iterator['PessoaFisica']:
+        return iter(self._por_cpf.values())
+
+    def __contains__(self: object, cpf: str) -> bool:
+        return cpf in self._por_cpf
+
+    @property
+    def contas(self: object) -> List['Conta']:
+        return list(self._contas.values())
+
+    @property
+    def total_contas(self: object) -> int:
+        return len(self._contas)
+
+    def cursor_contas(self: object) -> CursorContas:
+        """Cursor preguiçoso sobre as contas cadastradas, na ordem de abertura."""
+        return CursorContas(self._contas.values())
+
+    def adicionar(self: object, cliente: 'PessoaFisica') -> None:
+        """Registra um cliente novo, recusando CPFs já cadastrados."""
+        if cliente.cpf in self._por_cpf:
+            raise ValueError("Já existe cliente com esse CPF.")
+
+        self._por_cpf[cliente.cpf] = cliente
+        self._por_nome.append((cliente.nome.lower(), cliente.cpf))
+        self._por_nome_ordenado = False
+        for conta in cliente.contas:
+            self._contas[conta.numero] = conta
+        self._persistir(
+            {
+                "evento": "cliente",
+                "nome": cliente.nome,
+                "data_nascimento": cliente.data_nascimento,
+                "cpf": cliente.cpf,
+                "endereco": cliente.endereco,
+            }
+        )
+
+    def registrar_conta(self: object, conta: 'Conta') -> None:
+        """Indexa uma conta pelo número e a vincula ao titular."""
+        if conta.numero in self._contas:
+            raise ValueError("Já existe conta com esse número.")
+
+        self._contas[conta.numero] = conta
+        conta.cliente.adicionar_conta(conta)
+        self._persistido[conta.numero] = (len(conta.historico.transacoes), conta.saldo)
+        if self._armazenamento is None:
+            return
+
+        limite, limite_saques = self._limites(conta)
+        self._persistir(
+            {
+                "evento": "conta",
+                "numero": conta.numero,
+                "cpf": conta.cliente.cpf,
+                "limite": limite,
+                "limite_saques": limite_saques,
+            }
+        )
+
+    @staticmethod
+    def _limites(conta: 'Conta') -> Tuple[Union[int, None], Union[int, None]]:
+        """(limite em centavos, limite de saques) de uma ContaCorrente; (None, None) para outras contas."""
+        if isinstance(conta, ContaCorrente):
+            return conta._limite.centavos, conta._limite_saques
+        return None, None
+
+    @staticmethod
+    def _nova_conta(
+        numero: int, cliente: 'PessoaFisica', limite: Union[int, None], limite_saques: Union[int, None]
+    ) -> 'Conta':
+        """Recria a conta gravada por `registrar_conta` ou `exportar_estado`."""
+        if limite is None:
+            return Conta(numero, cliente)
+        return ContaCorrente(numero, cliente, Dinheiro(limite), limite_saques)
+
+    def registrar_movimento(self: object, conta: 'Conta') -> None:
+        """
+        Grava no diário o saldo e as transações da conta ainda não
+        persistidas. Não grava nada se a operação não alterou a conta.
+        """
+        persistidas, saldo = self._persistido.get(conta.numero, (0, Dinheiro()))
+        historico = conta.historico
+        if self._armazenamento is None or (len(historico.transacoes) == persistidas and conta.saldo == saldo):
+            return
+
+        self._persistido[conta.numero] = (len(historico.transacoes), conta.saldo)
+        self._persistir(
+            {
+                "evento": "movimento",
+                "numero": conta.numero,
+                "saldo": conta.saldo.centavos,
+                "data": int(datetime.now().timestamp()),
+                "transacoes": historico.exportar_transacoes(persistidas),
+            }
+        )
+
+    def _persistir(self: object, evento: dict) -> None:
+        if self._armazenamento is None:
+            return
+
+        self._armazenamento.registrar(evento)
+        if self._armazenamento.precisa_snapshot():
+            self._armazenamento.salvar_snapshot(self.exportar_estado())
+
+    def exportar_estado(self: object) -> dict:
+        """Retorna o estado completo do cadastro em estruturas compactas."""
+        return {
+            "tipos": list(Historico._tipos_conhecidos),
+            "clientes": [
+                (cliente.nome, cliente.data_nascimento, cliente.cpf, cliente.endereco) for cliente in self
+            ],
+            "contas": [
+                (
+                    conta.numero,
+                    conta.cliente.cpf,
+                    *self._limites(conta),
+                    conta.saldo.centavos,
+                    conta.historico.exportar_colunas(),
+                )
+                for conta in self._contas.values()
+            ],
+        }
+
+    def aplicar_evento(self: object, evento: dict) -> None:
+        """Reaplica um evento lido do diário."""
+        if evento["evento"] == "cliente":
+            self.adicionar(
+                PessoaFisica(
+                    nome=evento["nome"],
+                    data_nascimento=evento["data_nascimento"],
+                    cpf=evento["cpf"],
+                    endereco=evento["endereco"],
+                )
+            )
+        elif evento["evento"] == "conta":
+            cliente = self._por_cpf[evento["cpf"]]
+            self.registrar_conta(self._nova_conta(evento["numero"], cliente, evento["limite"], evento["limite_saques"]))
+        elif evento["evento"] == "movimento":
+            conta = self._contas[evento["numero"]]
+            conta._saldo = Dinheiro(evento["saldo"])
+            for tipo, centavos, data in evento["transacoes"]:
+                conta.historico.restaurar_transacao(tipo, centavos, data)
+            if "data" in evento:
+                conta.historico.consolidado.atualizar_saldo(date.fromtimestamp(evento["data"]), evento["saldo"])
+            self._persistido[conta.numero] = (len(conta.historico.transacoes), conta.saldo)
+        else:
+            raise ValueError(f"Evento desconhecido no diário: {evento['evento']}")
+
+    @classmethod
+    def restaurar(cls, armazenamento: Armazenamento) -> 'RegistroClientes':
+        """
+        Reconstrói o cadastro a partir do último snapshot e reaplica apenas
+        os eventos do diário posteriores a ele. Novas operações passam a ser
+        gravadas no mesmo armazenamento.
+        """
+        registro = cls()
+        estado = armazenamento.carregar_snapshot()
+        if estado is not None:
+            for nome, data_nascimento, cpf, endereco in estado["clientes"]:
+                registro.adicionar(PessoaFisica(nome, data_nascimento, cpf, endereco))
+            for numero, cpf, limite, limite_saques, saldo, colunas in estado["contas"]:
+                conta = cls._nova_conta(numero, registro._por_cpf[cpf], limite, limite_saques)
+                conta._saldo = Dinheiro(saldo)
+                conta.historico.importar_colunas(estado["tipos"], *colunas)
+                registro.registrar_conta(conta)
+
+        for evento in armazenamento.eventos_pendentes():
+            registro.aplicar_evento(evento)
+
+        registro._armazenamento = armazenamento
+        return registro
+
+    def fechar(self: object) -> None:
+        """Grava um snapshot final e libera o diário."""
+        if self._armazenamento is None:
+            return
+
+        self._armazenamento.salvar_snapshot(self.exportar_estado())
+        self._armazenamento.fechar()
+
+    def buscar_por_cpf(self: object, cpf: str) -> Union['PessoaFisica', None]:
+        return self._por_cpf.get(cpf)
+
+    def buscar_conta(self: object, numero: int) -> Union['Conta', None]:
+        return self._contas.get(numero)
+
+    def buscar_por_nome(self: object, prefixo: str) -> Generator['PessoaFisica', None, None]:
+        """
+        Retorna os clientes cujo nome começa com o prefixo informado,
+        em ordem alfabética, sem percorrer o cadastro inteiro.
+        """
+        if not self._por_nome_ordenado:
+            self._por_nome.sort()
+            self._por_nome_ordenado = True
+        prefixo = prefixo.lower()
+        inicio = bisect.bisect_left(self._por_nome, (prefixo, ""))
+        for indice in range(inicio, len(self._por_nome)):
+            nome, cpf = self._por_nome[indice]
+            if not nome.startswith(prefixo):
+                break
+            yield self._por_cpf[cpf]
 
 
 class Cliente:
@@ -42,31 +573,33 @@ class Cliente:
     Representa um cliente do banco com endereço e contas associadas.
     """
 
+    __slots__ = ("endereco", "contas", "limite_transacoes_diarias", "limite_transferencias_diarias")
+
     def __init__(self: object, endereco: str) -> None:
         self.endereco: str = endereco
         self.contas: List['Conta'] = []
         self.limite_transacoes_diarias: int = 10
         self.limite_transferencias_diarias: int = 5
 
-    def realizar_transacao(self, conta: 'Conta', transacao: 'Transacao') -> None:
+    def realizar_transacao(self, conta: 'Conta', transacao: 'Transacao') -> Resultado:
         """
         Realiza uma transação em uma conta associada ao cliente,
         verificando os limites diários de transações e transferências.
+        O resultado é retornado e também emitido para os ouvintes de `eventos`.
         """
         # Validar o número de transações do dia
-        transacoes_do_dia = conta.historico.transacoes_do_dia()
-        if len(transacoes_do_dia) >= self.limite_transacoes_diarias:
-            print("\n@@@ Você excedeu o número de transações permitidas para hoje! @@@")
-            return
+        if conta.historico.quantidade_do_dia() >= self.limite_transacoes_diarias:
+            resultado = Resultado.EXCEDEU_TRANSACOES_DIA
 
         # Verificar limite de transferências
-        transferencias_do_dia = [t for t in transacoes_do_dia if t["tipo"] == "Transferência"]
-        if len(transferencias_do_dia) >= self.limite_transferencias_diarias:
-            print("\n@@@ Você excedeu o número de transferências permitidas para hoje! @@@")
-            return
+        elif conta.historico.quantidade_do_dia("Transferência") >= self.limite_transferencias_diarias:
+            resultado = Resultado.EXCEDEU_TRANSFERENCIAS_DIA
+
+        else:
+            resultado = transacao.registrar(conta)
 
-        transacao.registrar(conta)
-        print("\n=== Transação realizada com sucesso! ===")
+        eventos.emitir(Evento(transacao.__class__.__name__, conta, transacao.valor, resultado))
+        return resultado
 
     def adicionar_conta(self, conta: 'Conta') -> None:
         """Adiciona uma conta ao cliente."""
@@ -79,6 +612,8 @@ class PessoaFisica(Cliente):
     Adiciona CPF, nome e data de nascimento com validação de CPF.
     """
 
+    __slots__ = ("nome", "data_nascimento", "cpf")
+
     def __init__(self: object, nome: str, data_nascimento: str, cpf: str, endereco: str) -> None:
         super().__init__(endereco)
         self.nome: str = nome
@@ -99,8 +634,10 @@ class Conta:
     Representa uma conta bancária genérica.
     """
 
+    __slots__ = ("_saldo", "_numero", "_agencia", "_cliente", "_historico")
+
     def __init__(self: object, numero: int, cliente: PessoaFisica) -> None:
-        self._saldo: float = 0
+        self._saldo: Dinheiro = Dinheiro()
         self._numero: int = numero
         self._agencia: str = "0001"
         self._cliente: PessoaFisica = cliente
@@ -112,7 +649,7 @@ class Conta:
         return cls(numero, cliente)
 
     @property
-    def saldo(self: object) -> float:
+    def saldo(self: object) -> Dinheiro:
         return self._saldo
 
     @property
@@ -131,31 +668,30 @@ class Conta:
     def historico(self: object) -> 'Historico':
         return self._historico
 
-    def sacar(self: object, valor: float) -> bool:
+    def sacar(self: object, valor: Dinheiro) -> Resultado:
         """
         Realiza um saque na conta, se houver saldo suficiente.
         """
-        if not isinstance(valor, (int, float)) or valor <= 0:
-            print("\n@@@ Operação falhou! O valor informado é inválido. @@@")
-            return False
+        valor = _valor_positivo(valor)
+        if valor is None:
+            return Resultado.VALOR_INVALIDO
 
         if valor > self._saldo:
-            print("\n@@@ Operação falhou! Você não tem saldo suficiente. @@@")
-            return False
+            return Resultado.SALDO_INSUFICIENTE
 
         self._saldo -= valor
-        return True
+        return Resultado.ACEITA
 
-    def depositar(self: object, valor: float) -> bool:
+    def depositar(self: object, valor: Dinheiro) -> Resultado:
         """
         Realiza um depósito na conta, aumentando o saldo.
         """
-        if not isinstance(valor, (int, float)) or valor <= 0:
-            print("\n@@@ Operação falhou! O valor informado é inválido. @@@")
-            return False
+        valor = _valor_positivo(valor)
+        if valor is None:
+            return Resultado.VALOR_INVALIDO
 
         self._saldo += valor
-        return True
+        return Resultado.ACEITA
 
 
 class ContaCorrente(Conta):
@@ -164,32 +700,45 @@ class ContaCorrente(Conta):
     Adiciona limite de saques e valor máximo para saques.
     """
 
-    def __init__(self: object, numero: int, cliente: PessoaFisica, limite: float = 500, limite_saques: int = 3) -> None:
+    __slots__ = ("_limite", "_limite_saques")
+
+    def __init__(
+        self: object,
+        numero: int,
+        cliente: PessoaFisica,
+        limite: Union[Dinheiro, float] = 500,
+        limite_saques: int = 3,
+    ) -> None:
         super().__init__(numero, cliente)
-        self._limite: float = limite
+        self._limite: Dinheiro = Dinheiro.de_reais(limite)
         self._limite_saques: int = limite_saques
 
     @classmethod
-    def nova_conta(cls, cliente: PessoaFisica, numero: int, limite: float, limite_saques: int) -> 'ContaCorrente':
+    def nova_conta(
+        cls, cliente: PessoaFisica, numero: int, limite: Union[Dinheiro, float], limite_saques: int
+    ) -> 'ContaCorrente':
         return cls(numero, cliente, limite, limite_saques)
 
-    def sacar(self: object, valor: float) -> bool:
+    @property
+    def estatisticas_saques(self: object) -> 'EstatisticasSaques':
+        return self.historico.saques
+
+    def sacar(self: object, valor: Dinheiro) -> Resultado:
         """
         Realiza um saque, verificando se o limite de saques ou valor foi excedido.
         """
-        numero_saques = len(
-            [transacao for transacao in self.historico.transacoes if transacao["tipo"] == "Saque"]
-        )
+        valor = _valor_positivo(valor)
+        if valor is None:
+            return Resultado.VALOR_INVALIDO
+
         excedeu_limite = valor > self._limite
-        excedeu_saques = numero_saques >= self._limite_saques
+        excedeu_saques = self.estatisticas_saques.quantidade >= self._limite_saques
 
         if excedeu_limite:
-            print("\n@@@ Operação falhou! O valor do saque excede o limite. @@@")
-        elif excedeu_saques:
-            print("\n@@@ Operação falhou! Número máximo de saques excedido. @@@")
-        else:
-            return super().sacar(valor)
-        return False
+            return Resultado.EXCEDEU_LIMITE_SAQUE
+        if excedeu_saques:
+            return Resultado.EXCEDEU_NUMERO_SAQUES
+        return super().sacar(valor)
 
     def __str__(self: object) -> str:
         return (
@@ -199,55 +748,443 @@ class ContaCorrente(Conta):
         )
 
 
+class Consolidacao(NamedTuple):
+    """Agregado de um dia, mês ou período de uma conta."""
+
+    depositos: Dinheiro
+    saques: Dinheiro
+    quantidade: int
+    saldo_final: Dinheiro
+
+
+class ConsolidadoConta:
+    """
+    Agregados diários e mensais de uma conta, mantidos incrementalmente a
+    cada transação: total depositado, total sacado, quantidade de
+    transações, saldo de fechamento do dia e quantidade de saques.
+    Relatórios de período, cálculos de juros e as estatísticas de saques
+    passam a ser consultas, sem reprocessar o histórico.
+    """
+
+    __slots__ = ("_dias", "_por_dia", "_por_mes", "_quantidade_saques", "_total_saques")
+
+    # Campos dos agregados: [depositos, saques, quantidade, saldo, quantidade de saques] por dia
+    # e [depositos, saques, quantidade, quantidade de saques] por mês.
+
+    def __init__(self: object) -> None:
+        self._dias: List[date] = []
+        self._por_dia: Dict[date, List[int]] = {}
+        self._por_mes: Dict[Tuple[int, int], List[int]] = {}
+        self._quantidade_saques: int = 0
+        self._total_saques: int = 0
+
+    def _dia(self: object, dia: date) -> List[int]:
+        """Agregado do dia, criado com o saldo anterior."""
+        agregado = self._por_dia.get(dia)
+        if agregado is None:
+            agregado = self._por_dia[dia] = [0, 0, 0, self._saldo_em(dia), 0]
+            if self._dias and dia < self._dias[-1]:
+                bisect.insort(self._dias, dia)
+            else:
+                self._dias.append(dia)
+        return agregado
+
+    def registrar(self: object, dia: date, depositado: int, sacado: int, saldo: Union[int, None] = None) -> None:
+        """
+        Contabiliza uma transação do dia, em centavos; `sacado` positivo
+        indica um saque. Sem o saldo da conta após a transação, o
+        fechamento é estimado pelo movimento.
+        """
+        saque = 1 if sacado else 0
+        agregado = self._dia(dia)
+        agregado[0] += depositado
+        agregado[1] += sacado
+        agregado[2] += 1
+        agregado[3] = agregado[3] + depositado - sacado if saldo is None else saldo
+        agregado[4] += saque
+
+        mensal = self._por_mes.setdefault((dia.year, dia.month), [0, 0, 0, 0])
+        mensal[0] += depositado
+        mensal[1] += sacado
+        mensal[2] += 1
+        mensal[3] += saque
+        self._quantidade_saques += saque
+        self._total_saques += sacado
+
+    def atualizar_saldo(self: object, dia: date, saldo: int) -> None:
+        """Registra o saldo após uma movimentação que não passa pelo histórico (ex.: transferências)."""
+        self._dia(dia)[3] = saldo
+
+    def _saldo_em(self: object, dia: date) -> int:
+        indice = bisect.bisect_right(self._dias, dia)
+        return self._por_dia[self._dias[indice - 1]][3] if indice else 0
+
+    def saldo_em(self: object, dia: date) -> Dinheiro:
+        """Saldo de fechamento do dia (o do último dia movimentado até ele)."""
+        return Dinheiro(self._saldo_em(dia))
+
+    def _somar(self: object, inicio: date, fim: date) -> List[int]:
+        """[depositos, saques, quantidade, quantidade de saques] entre as datas, inclusive."""
+        soma = [0, 0, 0, 0]
+        primeiro = bisect.bisect_left(self._dias, inicio)
+        ultimo = bisect.bisect_right(self._dias, fim, primeiro)
+        for indice in range(primeiro, ultimo):
+            depositos, saques, quantidade, _, quantidade_saques = self._por_dia[self._dias[indice]]
+            soma[0] += depositos
+            soma[1] += saques
+            soma[2] += quantidade
+            soma[3] += quantidade_saques
+        return soma
+
+    def do_dia(self: object, dia: date) -> Consolidacao:
+        depositos, saques, quantidade, _, _ = self._por_dia.get(dia, (0, 0, 0, 0, 0))
+        return Consolidacao(Dinheiro(depositos), Dinheiro(saques), quantidade, self.saldo_em(dia))
+
+    def do_mes(self: object, ano: int, mes: int) -> Consolidacao:
+        depositos, saques, quantidade, _ = self._por_mes.get((ano, mes), (0, 0, 0, 0))
+        ultimo_dia = date(ano, mes, calendar.monthrange(ano, mes)[1])
+        return Consolidacao(Dinheiro(depositos), Dinheiro(saques), quantidade, self.saldo_em(ultimo_dia))
+
+    def no_periodo(self: object, inicio: date, fim: date) -> Consolidacao:
+        """Agregado entre as datas, inclusive, percorrendo apenas os dias movimentados."""
+        depositos, saques, quantidade, _ = self._somar(inicio, fim)
+        return Consolidacao(Dinheiro(depositos), Dinheiro(saques), quantidade, self.saldo_em(fim))
+
+    def exportar(self: object) -> Dict[date, List[int]]:
+        return self._por_dia
+
+    def importar(self: object, por_dia: Dict[date, List[int]]) -> None:
+        """Carrega os agregados diários de um snapshot e recompõe os mensais e os totais de saques."""
+        self._dias = sorted(por_dia)
+        self._por_dia = {dia: list(por_dia[dia]) for dia in self._dias}
+        self._por_mes = {}
+        self._quantidade_saques = self._total_saques = 0
+        for dia in self._dias:
+            depositos, saques, quantidade, _, quantidade_saques = self._por_dia[dia]
+            mensal = self._por_mes.setdefault((dia.year, dia.month), [0, 0, 0, 0])
+            mensal[0] += depositos
+            mensal[1] += saques
+            mensal[2] += quantidade
+            mensal[3] += quantidade_saques
+            self._quantidade_saques += quantidade_saques
+            self._total_saques += saques
+
+
+class EstatisticasSaques:
+    """
+    Estatísticas de saques (quantidade e total geral, por dia e por mês),
+    lidas dos agregados do ConsolidadoConta da conta.
+    """
+
+    __slots__ = ("_consolidado",)
+
+    def __init__(self: object, consolidado: ConsolidadoConta) -> None:
+        self._consolidado = consolidado
+
+    @property
+    def quantidade(self: object) -> int:
+        return self._consolidado._quantidade_saques
+
+    @property
+    def total(self: object) -> Dinheiro:
+        return Dinheiro(self._consolidado._total_saques)
+
+    def do_dia(self: object, dia: date) -> Tuple[int, Dinheiro]:
+        """Retorna (quantidade, total) dos saques do dia."""
+        _, centavos, _, _, quantidade = self._consolidado._por_dia.get(dia, (0, 0, 0, 0, 0))
+        return quantidade, Dinheiro(centavos)
+
+    def do_mes(self: object, ano: int, mes: int) -> Tuple[int, Dinheiro]:
+        """Retorna (quantidade, total) dos saques do mês."""
+        _, centavos, _, quantidade = self._consolidado._por_mes.get((ano, mes), (0, 0, 0, 0))
+        return quantidade, Dinheiro(centavos)
+
+    def no_periodo(self: object, inicio: date, fim: date) -> Tuple[int, Dinheiro]:
+        """Retorna (quantidade, total) dos saques entre as datas, inclusive."""
+        _, centavos, _, quantidade = self._consolidado._somar(inicio, fim)
+        return quantidade, Dinheiro(centavos)
+
+
+class VisaoTransacoes(Sequence):
+    """
+    Visão somente leitura sobre as colunas do Historico. Cada transação
+    só é materializada como dicionário quando acessada.
+    """
+
+    def __init__(self: object, historico: 'Historico') -> None:
+        self._historico = historico
+
+    def __len__(self: object) -> int:
+        return len(self._historico._tipos)
+
+    def __getitem__(self: object, indice: Union[int, slice]) -> Union[dict, List[dict]]:
+        if isinstance(indice, slice):
+            return [self._historico._registro(i) for i in range(*indice.indices(len(self)))]
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("Índice de transação fora do intervalo.")
+        return self._historico._registro(indice)
+
+
 class Historico:
     """
     Armazena e gerencia as transações realizadas em uma conta.
+    As transações ficam em colunas compactas (array): código do tipo,
+    valor em centavos e data em segundos desde a época.
     """
 
+    __slots__ = ("_tipos", "_valores", "_datas", "_saques", "_consolidado", "_dia", "_contagem_dia", "_total_dia")
+
+    FORMATO_DATA = "%d-%m-%Y %H:%M:%S"
+    _tipos_conhecidos: List[str] = ["Saque", "Depósito", "Transferência"]
+    _codigos_tipo: Dict[str, int] = {tipo: codigo for codigo, tipo in enumerate(_tipos_conhecidos)}
+    _codigo_saque: int = _codigos_tipo["Saque"]
+    _codigo_deposito: int = _codigos_tipo["Depósito"]
+
     def __init__(self: object) -> None:
-        self._transacoes: List[dict] = []
+        self._tipos: array = array("B")
+        self._valores: array = array("q")
+        self._datas: array = array("q")
+        self._consolidado: ConsolidadoConta = ConsolidadoConta()
+        self._saques: EstatisticasSaques = EstatisticasSaques(self._consolidado)
+        self._dia: date = date.today()
+        self._contagem_dia: Dict[str, int] = {}
+        self._total_dia: int = 0
 
     @property
-    def transacoes(self: object) -> List[dict]:
-        return self._transacoes
+    def transacoes(self: object) -> VisaoTransacoes:
+        return VisaoTransacoes(self)
 
-    def adicionar_transacao(self: object, tipo: str, valor: float) -> None:
-        """Adiciona uma transação ao histórico, garantindo que não seja duplicada."""
-        if self._transacoes and self._transacoes[-1]["tipo"] == tipo and self._transacoes[-1]["valor"] == valor:
-            print("Transação duplicada detectada, não adicionada.")
-            return
-        self._transacoes.append(
-            {
-                "tipo": tipo,
-                "valor": valor,
-                "data": datetime.now().strftime("%d-%m-%Y %H:%M:%S"),
-            }
-        )
+    @property
+    def saques(self: object) -> EstatisticasSaques:
+        return self._saques
+
+    @property
+    def consolidado(self: object) -> ConsolidadoConta:
+        return self._consolidado
+
+    @classmethod
+    def _codigo_tipo(cls, tipo: str) -> int:
+        """Retorna o código numérico do tipo, registrando tipos novos."""
+        codigo = cls._codigos_tipo.get(tipo)
+        if codigo is None:
+            codigo = len(cls._tipos_conhecidos)
+            cls._tipos_conhecidos.append(tipo)
+            cls._codigos_tipo[tipo] = codigo
+        return codigo
+
+    def _registro(self: object, indice: int) -> dict:
+        """Monta o dicionário da transação armazenada na posição informada."""
+        return {
+            "tipo": self._tipos_conhecidos[self._tipos[indice]],
+            "valor": Dinheiro(self._valores[indice]),
+            "data": datetime.fromtimestamp(self._datas[indice]).strftime(self.FORMATO_DATA),
+        }
+
+    def eh_duplicada(self: object, tipo: str, valor: Dinheiro) -> bool:
+        """Indica se a transação repetiria a última do histórico (mesmo tipo e valor)."""
+        if not self._tipos or self._tipos[-1] != self._codigos_tipo.get(tipo):
+            return False
+        return self._valores[-1] == Dinheiro.de_reais(valor).centavos
 
-    def gerar_relatorio(self: object, tipo_transacao: Union[str, None] = None) -> Generator[dict, None, None]:
+    def adicionar_transacao(
+        self: object, tipo: str, valor: Dinheiro, saldo: Union[Dinheiro, None] = None
+    ) -> Resultado:
+        """
+        Adiciona uma transação ao histórico, garantindo que não seja duplicada.
+        `saldo` é o saldo da conta após a transação, usado no consolidado.
+        Quem altera o saldo deve consultar `eh_duplicada` antes de mover o dinheiro.
+        """
+        if self.eh_duplicada(tipo, valor):
+            return Resultado.TRANSACAO_DUPLICADA
+        codigo = self._codigo_tipo(tipo)
+        centavos = Dinheiro.de_reais(valor).centavos
+        agora = int(datetime.now().timestamp())
+        # Se o relógio do sistema voltar no tempo, a transação fica com a data da anterior.
+        if self._datas and agora < self._datas[-1]:
+            agora = self._datas[-1]
+        self._anexar(tipo, codigo, centavos, agora, None if saldo is None else saldo.centavos)
+        return Resultado.ACEITA
+
+    def _anexar(self: object, tipo: str, codigo: int, centavos: int, data: int, saldo: Union[int, None] = None) -> None:
+        """
+        Caminho único de inclusão (operações, lotes e reaplicação do diário).
+        A coluna de datas é o índice das buscas por período e precisa ficar
+        ordenada: uma data anterior à última levanta ValueError. Os valores
+        são conferidos antes de qualquer coluna ser alterada, para que as
+        três continuem com o mesmo tamanho.
+        """
+        if self._datas and data < self._datas[-1]:
+            raise ValueError("A data da transação é anterior à última do histórico.")
+        if abs(centavos) > Dinheiro.MAXIMO_CENTAVOS:
+            raise ValueError("O valor da transação excede o limite do histórico.")
+        dia = date.fromtimestamp(data)
+        self._tipos.append(codigo)
+        self._valores.append(centavos)
+        self._datas.append(data)
+        if codigo == self._codigo_saque:
+            self._consolidado.registrar(dia, 0, centavos, saldo)
+        elif codigo == self._codigo_deposito:
+            self._consolidado.registrar(dia, centavos, 0, saldo)
+        else:
+            self._consolidado.registrar(dia, 0, 0, saldo)
+        self._virar_dia(max(dia, self._dia))
+        if dia == self._dia:
+            self._contagem_dia[tipo] = self._contagem_dia.get(tipo, 0) + 1
+            self._total_dia += 1
+
+    def restaurar_transacao(self: object, tipo: str, centavos: int, data: int) -> None:
+        """
+        Anexa uma transação já validada, vinda do diário, sem checar duplicidade.
+        As datas devem vir em ordem cronológica, como em `_anexar`.
+        """
+        self._anexar(tipo, self._codigo_tipo(tipo), centavos, data)
+
+    def exportar_transacoes(self: object, inicio: int = 0) -> List[Tuple[str, int, int]]:
+        """Retorna (tipo, centavos, data) das transações a partir da posição informada."""
+        return [
+            (self._tipos_conhecidos[self._tipos[i]], self._valores[i], self._datas[i])
+            for i in range(inicio, len(self._tipos))
+        ]
+
+    def exportar_colunas(self: object) -> Tuple[bytes, bytes, bytes, Dict[date, List[int]]]:
+        return self._tipos.tobytes(), self._valores.tobytes(), self._datas.tobytes(), self._consolidado.exportar()
+
+    def importar_colunas(
+        self: object,
+        tipos_snapshot: List[str],
+        tipos: bytes,
+        valores: bytes,
+        datas: bytes,
+        consolidado: Dict[date, List[int]],
+    ) -> None:
+        """
+        Carrega as colunas gravadas em um snapshot, traduzindo os códigos de
+        tipo caso a tabela de tipos do processo atual seja diferente.
+        """
+        codigos = [self._codigo_tipo(tipo) for tipo in tipos_snapshot]
+        self._tipos = array("B", tipos)
+        if codigos != list(range(len(codigos))):
+            self._tipos = array("B", (codigos[codigo] for codigo in self._tipos))
+        self._valores = array("q", valores)
+        self._datas = array("q", datas)
+
+        self._consolidado = ConsolidadoConta()
+        self._saques = EstatisticasSaques(self._consolidado)
+        self._consolidado.importar(consolidado)
+
+        self._dia = date.today()
+        self._contagem_dia = {}
+        self._total_dia = 0
+        for transacao in self.transacoes_do_dia():
+            self._contagem_dia[transacao["tipo"]] = self._contagem_dia.get(transacao["tipo"], 0) + 1
+            self._total_dia += 1
+
+    def _virar_dia(self: object, hoje: date) -> None:
+        """Zera os contadores diários quando a data muda."""
+        if hoje != self._dia:
+            self._dia = hoje
+            self._contagem_dia = {}
+            self._total_dia = 0
+
+    def quantidade_do_dia(self: object, tipo: Union[str, None] = None) -> int:
+        """
+        Retorna quantas transações (de um tipo, se informado) foram
+        realizadas hoje, sem percorrer o histórico.
+        """
+        self._virar_dia(date.today())
+        if tipo is None:
+            return self._total_dia
+        return self._contagem_dia.get(tipo, 0)
+
+    def _intervalo(
+        self: object, inicio: Union[datetime, date, int, None], fim: Union[datetime, date, int, None]
+    ) -> Tuple[int, int]:
+        """Posições [primeiro, ultimo) das transações no período [inicio, fim), por busca binária."""
+        primeiro = 0 if inicio is None else bisect.bisect_left(self._datas, _segundos(inicio))
+        ultimo = len(self._datas) if fim is None else bisect.bisect_left(self._datas, _segundos(fim), primeiro)
+        return primeiro, ultimo
+
+    def gerar_relatorio(
+        self: object,
+        tipo_transacao: Union[str, None] = None,
+        *,
+        inicio: Union[datetime, date, int, None] = None,
+        fim: Union[datetime, date, int, None] = None,
+        deslocamento: int = 0,
+        limite: Union[int, None] = None,
+    ) -> Generator[dict, None, None]:
         """
         Gera um relatório de todas as transações ou filtra por tipo.
+        O período [inicio, fim) é localizado por busca binária na coluna de
+        datas, em O(log n + k); um `date` vale a meia-noite daquele dia.
+        Deslocamento e limite permitem paginar o resultado; valores negativos
+        levantam ValueError na chamada, antes da primeira transação.
+
+            historico.gerar_relatorio(inicio=date.today() - timedelta(days=30))
         """
-        for transacao in self._transacoes:
-            if tipo_transacao is None or transacao["tipo"].lower() == tipo_transacao.lower():
-                yield transacao
+        if deslocamento < 0:
+            raise ValueError("O deslocamento não pode ser negativo.")
+        if limite is not None and limite < 0:
+            raise ValueError("O limite não pode ser negativo.")
+        return self._gerar_relatorio(tipo_transacao, inicio, fim, deslocamento, limite)
+
+    def _gerar_relatorio(
+        self: object,
+        tipo_transacao: Union[str, None],
+        inicio: Union[datetime, date, int, None],
+        fim: Union[datetime, date, int, None],
+        deslocamento: int,
+        limite: Union[int, None],
+    ) -> Generator[dict, None, None]:
+        primeiro, ultimo = self._intervalo(inicio, fim)
+
+        if tipo_transacao is None:
+            primeiro = min(primeiro + deslocamento, ultimo)
+            if limite is not None:
+                ultimo = min(ultimo, primeiro + limite)
+            for indice in range(primeiro, ultimo):
+                yield self._registro(indice)
+            return
+
+        codigos = {
+            codigo for codigo, tipo in enumerate(self._tipos_conhecidos) if tipo.lower() == tipo_transacao.lower()
+        }
+        indices = (indice for indice in range(primeiro, ultimo) if self._tipos[indice] in codigos)
+        fim_pagina = None if limite is None else deslocamento + limite
+        for indice in itertools.islice(indices, deslocamento, fim_pagina):
+            yield self._registro(indice)
+
+    def quantidade_no_periodo(
+        self: object, inicio: Union[datetime, date, int], fim: Union[datetime, date, int], tipo: Union[str, None] = None
+    ) -> int:
+        """
+        Conta as transações com data no intervalo [inicio, fim),
+        localizando o intervalo por busca binária.
+        """
+        primeiro, ultimo = self._intervalo(inicio, fim)
+        if tipo is None:
+            return ultimo - primeiro
+        codigo = self._codigos_tipo.get(tipo)
+        return sum(1 for i in range(primeiro, ultimo) if self._tipos[i] == codigo)
 
     def transacoes_do_dia(self: object) -> List[dict]:
         """
         Retorna as transações realizadas no dia atual.
         """
-        hoje = datetime.now().strftime("%d-%m-%Y")
-        return [transacao for transacao in self._transacoes if transacao["data"].startswith(hoje)]
+        primeiro, ultimo = self._intervalo(date.today(), None)
+        return [self._registro(i) for i in range(primeiro, ultimo)]
 
     def mostrar_historico(self: object) -> None:
         """
         Exibe o histórico de transações da conta.
         """
-        if not self._transacoes:
+        if not self._tipos:
             print("\nNenhuma transação registrada.")
         else:
             print("\n=== Histórico de Transações ===")
-            for transacao in self._transacoes:
+            for transacao in self.gerar_relatorio():
                 print(f"{transacao['data']}: {transacao['tipo']} de R$ {transacao['valor']:.2f}")
 
 
@@ -256,13 +1193,15 @@ class Transacao(ABC):
     Classe abstrata para definir uma transação.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
-    def valor(self: object) -> float:
+    def valor(self: object) -> Dinheiro:
         pass
 
     @abstractmethod
-    def registrar(self: object, conta: Conta) -> None:
+    def registrar(self: object, conta: Conta) -> Resultado:
         pass
 
 
@@ -271,16 +1210,23 @@ class Saque(Transacao):
     Classe que representa a operação de saque.
     """
 
-    def __init__(self: object, valor: float) -> None:
-        self._valor: float = valor
+    __slots__ = ("_valor",)
+
+    def __init__(self: object, valor: Union[Dinheiro, float]) -> None:
+        self._valor: Dinheiro = Dinheiro.de_reais(valor)
 
     @property
-    def valor(self: object) -> float:
+    def valor(self: object) -> Dinheiro:
         return self._valor
 
-    def registrar(self: object, conta: Conta) -> None:
-        if conta.sacar(self.valor):
-            conta.historico.adicionar_transacao("Saque", self.valor)
+    def registrar(self: object, conta: Conta) -> Resultado:
+        # A duplicidade é verificada antes de debitar: recusada a transação, o saldo fica intacto.
+        if conta.historico.eh_duplicada("Saque", self.valor):
+            return Resultado.TRANSACAO_DUPLICADA
+        resultado = conta.sacar(self.valor)
+        if resultado:
+            resultado = conta.historico.adicionar_transacao("Saque", self.valor, conta.saldo)
+        return resultado
 
 
 class Deposito(Transacao):
@@ -288,31 +1234,106 @@ class Deposito(Transacao):
     Classe que representa a operação de depósito.
     """
 
-    def __init__(self: object, valor: float) -> None:
-        self._valor: float = valor
+    __slots__ = ("_valor",)
+
+    def __init__(self: object, valor: Union[Dinheiro, float]) -> None:
+        self._valor: Dinheiro = Dinheiro.de_reais(valor)
 
     @property
-    def valor(self: object) -> float:
+    def valor(self: object) -> Dinheiro:
         return self._valor
 
-    def registrar(self: object, conta: Conta) -> None:
-        if conta.depositar(self.valor):
-            conta.historico.adicionar_transacao("Depósito", self.valor)
+    def registrar(self: object, conta: Conta) -> Resultado:
+        # A duplicidade é verificada antes de creditar: recusada a transação, o saldo fica intacto.
+        if conta.historico.eh_duplicada("Depósito", self.valor):
+            return Resultado.TRANSACAO_DUPLICADA
+        resultado = conta.depositar(self.valor)
+        if resultado:
+            resultado = conta.historico.adicionar_transacao("Depósito", self.valor, conta.saldo)
+        return resultado
+
+
+class MotorTransferencias:
+    """
+    Executa transferências entre contas de forma atômica e segura para
+    uso com várias threads. Cada conta tem sua própria trava, e as duas
+    travas de uma transferência são sempre adquiridas em ordem crescente
+    de número de conta, o que evita deadlock entre transferências cruzadas.
+
+    Saques e depósitos feitos diretamente nas contas, fora do motor, não
+    passam pelas travas.
+    """
+
+    def __init__(self: object) -> None:
+        self._travas: Dict[int, threading.Lock] = {}
+        self._trava_registro = threading.Lock()
+
+    def _trava(self: object, conta: Conta) -> threading.Lock:
+        trava = self._travas.get(conta.numero)
+        if trava is None:
+            with self._trava_registro:
+                trava = self._travas.setdefault(conta.numero, threading.Lock())
+        return trava
+
+    def transferir(self: object, origem: Conta, destino: Conta, valor: Dinheiro) -> Resultado:
+        """
+        Debita a origem e credita o destino; se qualquer etapa falhar,
+        nenhuma das contas é alterada.
+        """
+        if origem.numero == destino.numero:
+            return Resultado.MESMA_CONTA
+
+        primeira, segunda = sorted((origem, destino), key=lambda conta: conta.numero)
+        with self._trava(primeira), self._trava(segunda):
+            resultado = origem.sacar(valor)
+            if resultado:
+                resultado = destino.depositar(valor)
+                if not resultado:
+                    origem.depositar(valor)
+            if resultado:
+                hoje = date.today()
+                origem.historico.consolidado.atualizar_saldo(hoje, origem.saldo.centavos)
+                destino.historico.consolidado.atualizar_saldo(hoje, destino.saldo.centavos)
+            return resultado
+
+    def executar(
+        self: object, transferencias: Iterable[Tuple[Conta, Conta, Dinheiro]], threads: int = 4
+    ) -> List[Resultado]:
+        """Executa as transferências em paralelo, retornando os resultados na ordem de entrada."""
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            return list(executor.map(lambda transferencia: self.transferir(*transferencia), transferencias))
+
+
+motor_transferencias = MotorTransferencias()
+
+
+metricas = Metricas()
 
 
 def log_transacao(func):
     """
     Decorator para registrar e logar transações realizadas no sistema.
+    Chamadas, erros e latência de cada operação são contabilizados em
+    `metricas`; o tempo de escrita do log não entra na medição.
     """
+    instrumentada = metricas.instrumentar()(func)
 
+    @functools.wraps(func)
     def envelope(*args, **kwargs):
-        resultado = func(*args, **kwargs)
+        resultado = instrumentada(*args, **kwargs)
         print(f"{datetime.now()}: {func.__name__.upper()} executado com sucesso.")
         return resultado
 
     return envelope
 
 
+def exibir_evento(evento: Evento) -> None:
+    """
+    Ouvinte da interface de console: exibe o resultado de cada transação.
+    """
+    print(evento.resultado.mensagem)
+
+
 def menu() -> str:
     """
     Exibe o menu principal do sistema e solicita a opção do usuário.
@@ -327,17 +1348,17 @@ def menu() -> str:
     [ncc]\tNova Conta
     [lcc]\tListar Contas
     [t]\tTransferir
+    [m]\tExportar Métricas
     [q]\tSair
     => """
     return input(textwrap.dedent(menu))
 
 
-def filtrar_cliente(cpf: str, clientes: List[PessoaFisica]) -> Union[PessoaFisica, None]:
+def filtrar_cliente(cpf: str, clientes: RegistroClientes) -> Union[PessoaFisica, None]:
     """
     Retorna o cliente com o CPF correspondente.
     """
-    clientes_filtrados = [cliente for cliente in clientes if cliente.cpf == cpf]
-    return clientes_filtrados[0] if clientes_filtrados else None
+    return clientes.buscar_por_cpf(cpf)
 
 
 def recuperar_conta_cliente(cliente: PessoaFisica) -> Union[Conta, None]:
@@ -357,7 +1378,7 @@ def recuperar_conta_cliente(cliente: PessoaFisica) -> Union[Conta, None]:
 
 
 @log_transacao
-def depositar(clientes: List[PessoaFisica]) -> None:
+def depositar(clientes: RegistroClientes) -> None:
     """
     Realiza a operação de depósito em uma conta de um cliente.
     """
@@ -368,7 +1389,7 @@ def depositar(clientes: List[PessoaFisica]) -> None:
         print("\n@@@ Cliente não encontrado! @@@")
         return
 
-    valor = float(input("Informe o valor do depósito: "))
+    valor = Dinheiro.de_reais(input("Informe o valor do depósito: "))
     transacao = Deposito(valor)
 
     conta = recuperar_conta_cliente(cliente)
@@ -376,10 +1397,11 @@ def depositar(clientes: List[PessoaFisica]) -> None:
         return
 
     cliente.realizar_transacao(conta, transacao)
+    clientes.registrar_movimento(conta)
 
 
 @log_transacao
-def sacar(clientes: List[PessoaFisica]) -> None:
+def sacar(clientes: RegistroClientes) -> None:
     """
     Realiza a operação de saque em uma conta de um cliente.
     """
@@ -390,7 +1412,7 @@ def sacar(clientes: List[PessoaFisica]) -> None:
         print("\n@@@ Cliente não encontrado! @@@")
         return
 
-    valor = float(input("Informe o valor do saque: "))
+    valor = Dinheiro.de_reais(input("Informe o valor do saque: "))
     transacao = Saque(valor)
 
     conta = recuperar_conta_cliente(cliente)
@@ -398,10 +1420,51 @@ def sacar(clientes: List[PessoaFisica]) -> None:
         return
 
     cliente.realizar_transacao(conta, transacao)
+    clientes.registrar_movimento(conta)
+
+
+def escrever_extrato(
+    conta: Conta,
+    saida: TextIO,
+    inicio: Union[datetime, date, int, None] = None,
+    fim: Union[datetime, date, int, None] = None,
+    pagina: Union[int, None] = None,
+    tamanho_pagina: int = 50,
+    tamanho_bloco: int = 500,
+) -> None:
+    """
+    Escreve o extrato da conta na saída informada (arquivo, sys.stdout...),
+    em blocos de até `tamanho_bloco` linhas, sem montar o texto inteiro
+    em memória. O período [inicio, fim) e a página (a partir de 1) são
+    filtrados pelo próprio Historico. Página ou tamanho de página menores
+    que 1 levantam ValueError antes de qualquer escrita.
+    """
+    deslocamento, limite = 0, None
+    if pagina is not None:
+        if pagina < 1 or tamanho_pagina < 1:
+            raise ValueError("A página e o tamanho da página devem ser maiores que zero.")
+        deslocamento, limite = (pagina - 1) * tamanho_pagina, tamanho_pagina
+
+    saida.write("\n================ EXTRATO ================\n")
+    bloco: List[str] = []
+    tem_transacao = False
+    for transacao in conta.historico.gerar_relatorio(inicio=inicio, fim=fim, deslocamento=deslocamento, limite=limite):
+        tem_transacao = True
+        bloco.append(f"\n{transacao['tipo']} - R$ {transacao['valor']:.2f} em {transacao['data']}")
+        if len(bloco) >= tamanho_bloco:
+            saida.write("".join(bloco))
+            bloco.clear()
+    saida.write("".join(bloco))
+
+    if not tem_transacao:
+        saida.write("Não foram realizadas movimentações")
+
+    saida.write(f"\n\nSaldo:\n\tR$ {conta.saldo:.2f}\n")
+    saida.write("==========================================\n")
 
 
 @log_transacao
-def exibir_extrato(clientes: List[PessoaFisica]) -> None:
+def exibir_extrato(clientes: RegistroClientes) -> None:
     """
     Exibe o extrato de uma conta de um cliente.
     """
@@ -416,23 +1479,17 @@ def exibir_extrato(clientes: List[PessoaFisica]) -> None:
     if not conta:
         return
 
-    print("\n================ EXTRATO ================")
-    extrato = ""
-    tem_transacao = False
-    for transacao in conta.historico.gerar_relatorio():
-        tem_transacao = True
-        extrato += f"\n{transacao['tipo']} - R$ {transacao['valor']:.2f} em {transacao['data']}"
-
-    if not tem_transacao:
-        extrato = "Não foram realizadas movimentações"
+    dias = input("Informe quantos dias exibir (Enter para todo o histórico): ").strip()
+    if dias and (not dias.isdigit() or int(dias) < 1):
+        print("\n@@@ Número de dias inválido! @@@")
+        return
 
-    print(extrato)
-    print(f"\nSaldo:\n\tR$ {conta.saldo:.2f}")
-    print("==========================================")
+    inicio = date.today() - timedelta(days=int(dias) - 1) if dias else None
+    escrever_extrato(conta, sys.stdout, inicio=inicio)
 
 
 @log_transacao
-def novo_cliente(clientes: List[PessoaFisica]) -> None:
+def novo_cliente(clientes: RegistroClientes) -> None:
     """
     Cria um novo cliente com os dados fornecidos.
     """
@@ -448,12 +1505,12 @@ def novo_cliente(clientes: List[PessoaFisica]) -> None:
     endereco = input("Informe o endereço (logradouro, nro - bairro - cidade/sigla estado): ")
 
     cliente = PessoaFisica(nome=nome, data_nascimento=data_nascimento, cpf=cpf, endereco=endereco)
-    clientes.append(cliente)
+    clientes.adicionar(cliente)
 
     print("\n=== Cliente criado com sucesso! ===")
 
 
-def listar_clientes(clientes: List[PessoaFisica]) -> None:
+def listar_clientes(clientes: RegistroClientes) -> None:
     """
     Exibe a lista de clientes cadastrados.
     """
@@ -468,7 +1525,7 @@ def listar_clientes(clientes: List[PessoaFisica]) -> None:
 
 
 @log_transacao
-def criar_conta(numero_conta: int, clientes: List[PessoaFisica], contas: List[ContaCorrente]) -> None:
+def criar_conta(numero_conta: int, clientes: RegistroClientes) -> None:
     """
     Cria uma nova conta corrente para um cliente existente.
     """
@@ -480,28 +1537,29 @@ def criar_conta(numero_conta: int, clientes: List[PessoaFisica], contas: List[Co
         return
 
     conta = ContaCorrente.nova_conta(cliente=cliente, numero=numero_conta, limite=500, limite_saques=50)
-    contas.append(conta)
-    cliente.adicionar_conta(conta)
+    clientes.registrar_conta(conta)
 
     print("\n=== Conta criada com sucesso! ===")
 
 
-def listar_contas(contas: List[ContaCorrente]) -> None:
+def listar_contas(contas: CursorContas) -> None:
     """
-    Exibe a lista de contas cadastradas.
+    Exibe a lista de contas cadastradas, formatando uma conta por vez.
     """
-    if not contas:
+    total = 0
+    for texto in contas.formatar():
+        total += 1
+        print("=" * 100)
+        print(textwrap.dedent(texto))
+
+    if not total:
         print("\nNenhuma conta cadastrada.")
         return
-
-    for conta in ContasIterador(contas):
-        print("=" * 100)
-        print(textwrap.dedent(conta))
-    print("\n=== Total de contas: {} ===".format(len(contas)))
+    print("\n=== Total de contas: {} ===".format(total))
 
 
 @log_transacao
-def transferir(clientes: List[PessoaFisica]) -> None:
+def transferir(clientes: RegistroClientes) -> None:
     """
     Realiza uma transferência entre contas de clientes diferentes.
     """
@@ -527,12 +1585,15 @@ def transferir(clientes: List[PessoaFisica]) -> None:
     if not conta_destino:
         return
 
-    valor = float(input("Informe o valor a ser transferido: "))
+    valor = Dinheiro.de_reais(input("Informe o valor a ser transferido: "))
 
-    if conta_origem.sacar(valor):
-        conta_destino.depositar(valor)
+    resultado = motor_transferencias.transferir(conta_origem, conta_destino, valor)
+    if resultado:
+        clientes.registrar_movimento(conta_origem)
+        clientes.registrar_movimento(conta_destino)
         print("\n=== Transferência realizada com sucesso! ===")
     else:
+        print(resultado.mensagem)
         print("\n@@@ Falha na transferência! @@@")
 
 
@@ -540,8 +1601,8 @@ def main() -> None:
     """
     Função principal que controla o fluxo do sistema bancário.
     """
-    clientes: List[PessoaFisica] = []
-    contas: List[ContaCorrente] = []
+    clientes = RegistroClientes.restaurar(Armazenamento(ROOT_PATH / "dados"))
+    eventos.inscrever(exibir_evento)
 
     while True:
         opcao = menu()
@@ -562,20 +1623,27 @@ def main() -> None:
             listar_clientes(clientes)
 
         elif opcao == "ncc":
-            numero_conta = len(contas) + 1
-            criar_conta(numero_conta, clientes, contas)
+            numero_conta = clientes.total_contas + 1
+            criar_conta(numero_conta, clientes)
 
         elif opcao == "lcc":
-            listar_contas(contas)
+            listar_contas(clientes.cursor_contas())
 
         elif opcao == "t":
             transferir(clientes)
 
+        elif opcao == "m":
+            caminho = ROOT_PATH / "dados" / "metricas.prom"
+            metricas.exportar_prometheus(caminho)
+            print(f"\n=== Métricas exportadas para {caminho} ===")
+
         elif opcao == "q":
+            clientes.fechar()
             break
 
         else:
             print("\n@@@ Operação inválida, por favor selecione novamente a operação desejada. @@@")
 
 
-main()
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,335 @@
+"""
+Livro-razão particionado: as contas são distribuídas por número entre
+vários processos (partições), contornando o GIL no processamento em lote.
+
+Cada partição mantém seu próprio RegistroClientes e recebe lotes de
+operações por uma fila. Transferências entre partições diferentes usam
+uma entrega em duas fases coordenada pelo processo principal:
+
+1. a partição de origem reserva o valor (debita a conta);
+2. a partição de destino credita o valor; se o crédito falhar, a
+   origem estorna a reserva.
+
+Se uma partição falhar em qualquer das fases, as reservas aceitas e
+ainda não creditadas são estornadas antes de o erro ser levantado.
+"""
+import multiprocessing
+import os
+import queue
+import time
+import traceback
+from array import array
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Tuple, Union
+
+from desafio_v4 import ContaCorrente, Dinheiro, MotorTransferencias, PessoaFisica, RegistroClientes, Resultado
+from lote import aplicar_lote
+
+Operacao = Tuple
+
+
+def _processar(
+    registro: RegistroClientes, motor: MotorTransferencias, operacoes: List[Operacao], resultados: List[int]
+) -> None:
+    """
+    Aplica, em ordem, as operações recebidas por uma partição, anexando
+    os resultados a `resultados` à medida que são obtidos.
+    """
+    movimentos: List[Tuple] = []
+
+    def aplicar_movimentos() -> None:
+        if movimentos:
+            resultados.extend(aplicar_lote(movimentos, registro))
+            movimentos.clear()
+
+    for operacao in operacoes:
+        nome = operacao[0]
+        if nome == "movimento":
+            _, numero, tipo, centavos, data = operacao
+            movimentos.append((numero, tipo, Dinheiro(centavos), data))
+            continue
+
+        aplicar_movimentos()
+        if nome == "abrir":
+            _, numero, cpf, nome_cliente, limite, limite_saques = operacao
+            cliente = registro.buscar_por_cpf(cpf)
+            if cliente is None:
+                cliente = PessoaFisica(nome_cliente, "", cpf, "")
+                registro.adicionar(cliente)
+            registro.registrar_conta(ContaCorrente(numero, cliente, Dinheiro(limite), limite_saques))
+            resultados.append(Resultado.ACEITA)
+        elif nome == "saldo":
+            conta = registro.buscar_conta(operacao[1])
+            resultados.append(conta.saldo.centavos if conta is not None else None)
+        elif nome == "transferir":
+            _, origem, destino, centavos = operacao
+            conta_origem, conta_destino = registro.buscar_conta(origem), registro.buscar_conta(destino)
+            if conta_origem is None or conta_destino is None:
+                resultados.append(Resultado.CONTA_INEXISTENTE)
+            else:
+                resultados.append(motor.transferir(conta_origem, conta_destino, Dinheiro(centavos)))
+        elif nome in ("reservar", "creditar", "estornar"):
+            _, numero, centavos = operacao
+            conta = registro.buscar_conta(numero)
+            if conta is None:
+                resultados.append(Resultado.CONTA_INEXISTENTE)
+            else:
+                if nome == "reservar":
+                    resultados.append(conta.sacar(Dinheiro(centavos)))
+                else:
+                    resultados.append(conta.depositar(Dinheiro(centavos)))
+                conta.historico.consolidado.atualizar_saldo(date.today(), conta.saldo.centavos)
+        else:
+            raise ValueError(f"Operação desconhecida: {nome}")
+
+    aplicar_movimentos()
+
+
+def _trabalhador(indice: int, entrada: multiprocessing.Queue, saida: multiprocessing.Queue) -> None:
+    """
+    Processa os lotes da partição. Uma exceção não encerra o processo:
+    o traceback volta como texto junto dos resultados das operações
+    anteriores à falha, que permanecem aplicadas.
+    """
+    registro = RegistroClientes()
+    motor = MotorTransferencias()
+    while True:
+        operacoes = entrada.get()
+        if operacoes is None:
+            break
+        resultados: List[int] = []
+        try:
+            _processar(registro, motor, operacoes, resultados)
+            erro = None
+        except Exception:
+            erro = traceback.format_exc()
+        saida.put((indice, resultados, erro))
+
+
+def _validar(posicao: int, operacao: Operacao) -> None:
+    """Levanta ValueError se a operação não tiver um dos formatos aceitos por LivroParticionado.executar."""
+    valida = False
+    if isinstance(operacao, (tuple, list)) and operacao:
+        if operacao[0] == "Transferência":
+            valida = len(operacao) == 4 and all(isinstance(valor, int) for valor in operacao[1:])
+        else:
+            valida = (
+                len(operacao) in (3, 4)
+                and all(isinstance(valor, int) for valor in operacao[1:3])
+                and (len(operacao) == 3 or isinstance(operacao[3], (int, datetime)))
+            )
+    if not valida:
+        raise ValueError(f"Operação inválida na posição {posicao}: {operacao!r}")
+
+
+class LivroParticionado:
+    """
+    Distribui as contas entre `particoes` processos pelo resto da divisão
+    do número da conta. Use como gerenciador de contexto para garantir o
+    encerramento dos processos.
+    """
+
+    INTERVALO_VERIFICACAO = 1.0  # segundos entre verificações de partições encerradas
+
+    def __init__(self: object, particoes: Union[int, None] = None) -> None:
+        self._total = particoes or os.cpu_count() or 1
+        self._saida = multiprocessing.Queue()
+        self._entradas = [multiprocessing.Queue() for _ in range(self._total)]
+        self._processos = [
+            multiprocessing.Process(target=_trabalhador, args=(indice, entrada, self._saida), daemon=True)
+            for indice, entrada in enumerate(self._entradas)
+        ]
+        for processo in self._processos:
+            processo.start()
+
+    def __enter__(self: object) -> 'LivroParticionado':
+        return self
+
+    def __exit__(self: object, *_) -> None:
+        self.fechar()
+
+    def particao(self: object, numero: int) -> int:
+        return numero % self._total
+
+    def _rodada(
+        self: object, por_particao: Dict[int, List[Operacao]]
+    ) -> Tuple[Dict[int, List[int]], Dict[int, str]]:
+        """
+        Envia um lote a cada partição e aguarda todas as respostas. Retorna
+        os resultados por partição e as falhas (traceback ou aviso de
+        partição encerrada) por partição. Uma partição que falhou traz
+        apenas os resultados das operações anteriores à falha.
+        """
+        for indice, operacoes in por_particao.items():
+            self._entradas[indice].put(operacoes)
+        respostas: Dict[int, List[int]] = {}
+        falhas: Dict[int, str] = {}
+        while len(respostas) < len(por_particao):
+            try:
+                indice, resultados, erro = self._saida.get(timeout=self.INTERVALO_VERIFICACAO)
+            except queue.Empty:
+                for indice in por_particao.keys() - respostas.keys():
+                    if not self._processos[indice].is_alive():
+                        respostas[indice] = []
+                        falhas[indice] = f"A partição {indice} encerrou sem responder."
+                continue
+            respostas[indice] = resultados
+            if erro is not None:
+                falhas[indice] = erro
+        return respostas, falhas
+
+    @staticmethod
+    def _erro(falhas: Dict[int, str]) -> RuntimeError:
+        detalhes = "\n".join(f"Partição {indice}:\n{erro}" for indice, erro in sorted(falhas.items()))
+        return RuntimeError(f"Falha ao processar o lote.\n{detalhes}")
+
+    def _exigir(self: object, por_particao: Dict[int, List[Operacao]]) -> Dict[int, List[int]]:
+        """Executa uma rodada e levanta RuntimeError se alguma partição falhar."""
+        respostas, falhas = self._rodada(por_particao)
+        if falhas:
+            raise self._erro(falhas)
+        return respostas
+
+    def abrir_contas(
+        self: object, contas: Iterable[Tuple[int, str, str]], limite: int = 50_000, limite_saques: int = 3
+    ) -> None:
+        """Abre contas (numero, cpf, nome) nas partições correspondentes; limite em centavos."""
+        por_particao: Dict[int, List[Operacao]] = {}
+        for numero, cpf, nome in contas:
+            por_particao.setdefault(self.particao(numero), []).append(
+                ("abrir", numero, cpf, nome, limite, limite_saques)
+            )
+        self._exigir(por_particao)
+
+    def saldo(self: object, numero: int) -> Union[Dinheiro, None]:
+        centavos = self._exigir({self.particao(numero): [("saldo", numero)]})[self.particao(numero)][0]
+        return Dinheiro(centavos) if centavos is not None else None
+
+    def executar(self: object, operacoes: Iterable[Operacao]) -> array:
+        """
+        Executa um lote de operações e retorna um array('b') de Resultado
+        na ordem de entrada. Formatos aceitos (valores em centavos):
+
+        - ("Depósito" | "Saque", numero, centavos[, data])
+        - ("Transferência", origem, destino, centavos)
+
+        A ordem é preservada dentro de cada partição. Créditos de
+        transferências entre partições só chegam ao destino depois das
+        demais operações do lote naquela partição.
+
+        Operações em outro formato levantam ValueError antes do envio.
+        Se uma partição falhar, as reservas aceitas e não creditadas são
+        estornadas e RuntimeError é levantado; as demais operações já
+        aplicadas permanecem.
+        """
+        operacoes = list(operacoes)
+        for posicao, operacao in enumerate(operacoes):
+            _validar(posicao, operacao)
+
+        por_particao: Dict[int, List[Operacao]] = {}
+        posicoes: Dict[int, List[int]] = {}
+        cruzadas: List[Tuple[int, int, int, int]] = []
+        resultados = array("b")
+
+        def enviar(indice: int, posicao: int, operacao: Operacao) -> None:
+            por_particao.setdefault(indice, []).append(operacao)
+            posicoes.setdefault(indice, []).append(posicao)
+
+        agora = int(time.time())
+        for posicao, operacao in enumerate(operacoes):
+            resultados.append(Resultado.ACEITA)
+            if operacao[0] == "Transferência":
+                _, origem, destino, centavos = operacao
+                particao_origem, particao_destino = self.particao(origem), self.particao(destino)
+                if origem == destino:
+                    resultados[posicao] = Resultado.MESMA_CONTA
+                elif particao_origem == particao_destino:
+                    enviar(particao_origem, posicao, ("transferir", origem, destino, centavos))
+                else:
+                    enviar(particao_origem, posicao, ("reservar", origem, centavos))
+                    cruzadas.append((posicao, origem, destino, centavos))
+            else:
+                tipo, numero, centavos = operacao[:3]
+                data = operacao[3] if len(operacao) > 3 else agora
+                enviar(self.particao(numero), posicao, ("movimento", numero, tipo, centavos, data))
+
+        respostas, falhas = self._rodada(por_particao)
+        respondidas = set()
+        for indice, codigos in respostas.items():
+            for posicao, codigo in zip(posicoes[indice], codigos):
+                resultados[posicao] = codigo
+                respondidas.add(posicao)
+
+        reservadas = [
+            cruzada for cruzada in cruzadas if cruzada[0] in respondidas and resultados[cruzada[0]] == Resultado.ACEITA
+        ]
+        estornos: Dict[int, List[Operacao]] = {}
+
+        def estornar(origem: int, centavos: int) -> None:
+            estornos.setdefault(self.particao(origem), []).append(("estornar", origem, centavos))
+
+        if falhas:
+            # Nenhum crédito é enviado: o dinheiro reservado volta à origem.
+            for posicao, origem, destino, centavos in reservadas:
+                estornar(origem, centavos)
+        else:
+            # Segunda fase: creditar no destino as reservas aceitas.
+            creditos: Dict[int, List[Operacao]] = {}
+            for posicao, origem, destino, centavos in reservadas:
+                creditos.setdefault(self.particao(destino), []).append(("creditar", destino, centavos))
+            respostas, falhas = self._rodada(creditos)
+
+            consumidas = {indice: iter(codigos) for indice, codigos in respostas.items()}
+            for posicao, origem, destino, centavos in reservadas:
+                codigo = next(consumidas[self.particao(destino)], None)
+                if codigo != Resultado.ACEITA:
+                    if codigo is not None:
+                        resultados[posicao] = codigo
+                    estornar(origem, centavos)
+
+        falhas = {**self._rodada(estornos)[1], **falhas}
+        if falhas:
+            raise self._erro(falhas)
+        return resultados
+
+    def fechar(self: object) -> None:
+        for entrada in self._entradas:
+            entrada.put(None)
+        for processo in self._processos:
+            processo.join()
+
+
+def main() -> None:
+    """Compara a vazão do lote noturno sintético com 1, 2, 4... partições."""
+    import random
+
+    aleatorio = random.Random(42)
+    total_contas, total_operacoes = 10_000, 200_000
+    inicio_dia = int(time.time()) - 86_400 * 60
+    operacoes = []
+    for indice in range(total_operacoes):
+        numero = aleatorio.randint(1, total_contas)
+        data = inicio_dia + indice * 86_400 * 60 // total_operacoes
+        sorteio = aleatorio.random()
+        if sorteio < 0.6:
+            operacoes.append(("Depósito", numero, aleatorio.randint(100, 100_000), data))
+        elif sorteio < 0.9:
+            operacoes.append(("Saque", numero, aleatorio.randint(100, 50_000), data))
+        else:
+            destino = aleatorio.randint(1, total_contas)
+            operacoes.append(("Transferência", numero, destino, aleatorio.randint(1, 50_000)))
+
+    particoes = 1
+    while particoes <= (os.cpu_count() or 1):
+        with LivroParticionado(particoes) as livro:
+            livro.abrir_contas((numero, f"{numero:011d}", "Cliente") for numero in range(1, total_contas + 1))
+            inicio = time.perf_counter()
+            resultados = livro.executar(operacoes)
+            duracao = time.perf_counter() - inicio
+        aceitas = sum(1 for codigo in resultados if codigo == Resultado.ACEITA)
+        print(f"{particoes:>3} partições: {total_operacoes / duracao:>10.0f} operações/s ({aceitas} aceitas)")
+        particoes *= 2
+
+
+if __name__ == "__main__":
+    main()
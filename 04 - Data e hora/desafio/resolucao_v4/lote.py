@@ -0,0 +1,115 @@
+from array import array
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, Tuple, Union
+
+from desafio_v4 import Conta, ContaCorrente, Dinheiro, Historico, RegistroClientes, Resultado
+
+
+Linha = Tuple[Union[Conta, int], str, Dinheiro, Union[int, datetime]]
+
+_SAQUE = Historico._codigo_tipo("Saque")
+_DEPOSITO = Historico._codigo_tipo("Depósito")
+
+
+def _inicio_do_dia(dia: date) -> int:
+    return int(datetime.combine(dia, datetime.min.time()).timestamp())
+
+
+def aplicar_lote(linhas: Iterable[Linha], registro: Union[RegistroClientes, None] = None) -> array:
+    """
+    Aplica em ordem um lote de linhas (conta, tipo, valor, data) com as
+    mesmas regras de Cliente.realizar_transacao e ContaCorrente.sacar:
+    limite diário de transações do cliente, valor máximo por saque,
+    número máximo de saques e saldo disponível.
+
+    - conta: objeto Conta ou número da conta (exige o registro);
+    - tipo: "Saque" ou "Depósito";
+    - valor: Dinheiro, como em Saque e Deposito; outros tipos são recusados
+      com VALOR_INVALIDO, para que um número não seja lido como centavos
+      aqui e como reais no restante do domínio;
+    - data: segundos desde a época ou datetime. As linhas de cada conta
+      devem estar em ordem cronológica e não podem ser anteriores à última
+      transação do histórico; as que forem são recusadas com
+      DATA_FORA_DE_ORDEM, pois a coluna de datas é o índice das buscas.
+      Linhas posteriores ao início do lote são recusadas com DATA_FUTURA:
+      aceitas, levariam as transações seguintes da conta para aquela data.
+
+    Retorna um array('b') com um código de Resultado por linha.
+    Nada é impresso; os saldos são gravados nas contas ao final do lote.
+    """
+    resultados = array("b")
+    saldos: Dict[Conta, int] = {}
+    transacoes_dia: Dict[Tuple[Conta, int], int] = {}
+    agora = int(datetime.now().timestamp())
+
+    try:
+        for conta, tipo, valor, data in linhas:
+            if not isinstance(conta, Conta):
+                conta = registro.buscar_conta(conta) if registro is not None else None
+                if conta is None:
+                    resultados.append(Resultado.CONTA_INEXISTENTE)
+                    continue
+
+            if tipo == "Saque":
+                codigo = _SAQUE
+            elif tipo == "Depósito":
+                codigo = _DEPOSITO
+            else:
+                resultados.append(Resultado.TIPO_INVALIDO)
+                continue
+
+            if isinstance(data, datetime):
+                data = int(data.timestamp())
+            datas = conta.historico._datas
+            if datas and data < datas[-1]:
+                resultados.append(Resultado.DATA_FORA_DE_ORDEM)
+                continue
+            if data > agora:
+                resultados.append(Resultado.DATA_FUTURA)
+                continue
+
+            dia = date.fromtimestamp(data)
+            inicio_dia = _inicio_do_dia(dia)
+            chave_dia = (conta, inicio_dia)
+            quantidade_dia = transacoes_dia.get(chave_dia)
+            if quantidade_dia is None:
+                fim_dia = _inicio_do_dia(dia + timedelta(days=1))
+                quantidade_dia = conta.historico.quantidade_no_periodo(inicio_dia, fim_dia)
+            if quantidade_dia >= conta.cliente.limite_transacoes_diarias:
+                resultados.append(Resultado.EXCEDEU_TRANSACOES_DIA)
+                continue
+
+            if not isinstance(valor, Dinheiro) or not 0 < valor.centavos <= Dinheiro.MAXIMO_CENTAVOS:
+                resultados.append(Resultado.VALOR_INVALIDO)
+                continue
+            centavos = valor.centavos
+
+            saldo = saldos.get(conta)
+            if saldo is None:
+                saldo = conta.saldo.centavos
+
+            if codigo == _SAQUE:
+                if isinstance(conta, ContaCorrente):
+                    if centavos > conta._limite.centavos:
+                        resultados.append(Resultado.EXCEDEU_LIMITE_SAQUE)
+                        continue
+                    if conta.estatisticas_saques.quantidade >= conta._limite_saques:
+                        resultados.append(Resultado.EXCEDEU_NUMERO_SAQUES)
+                        continue
+                if centavos > saldo:
+                    resultados.append(Resultado.SALDO_INSUFICIENTE)
+                    continue
+                saldos[conta] = saldo - centavos
+            else:
+                saldos[conta] = saldo + centavos
+
+            conta.historico._anexar(tipo, codigo, centavos, data, saldos[conta])
+            transacoes_dia[chave_dia] = quantidade_dia + 1
+            resultados.append(Resultado.ACEITA)
+    finally:
+        for conta, saldo in saldos.items():
+            conta._saldo = Dinheiro(saldo)
+            if registro is not None:
+                registro.registrar_movimento(conta)
+
+    return resultados
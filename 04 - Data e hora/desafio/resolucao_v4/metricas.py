@@ -0,0 +1,134 @@
+import functools
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Union
+
+
+class EstatisticasOperacao:
+    """
+    Contadores de uma operação instrumentada. O histograma de latência usa
+    baldes em potências de 2 nanossegundos: o balde i conta as chamadas com
+    duração menor que 2**i ns, e o último também acumula as mais lentas.
+    O número de chamadas é a soma dos baldes.
+    """
+
+    __slots__ = ("erros", "soma_ns", "baldes")
+
+    def __init__(self: object, total_baldes: int) -> None:
+        self.erros: int = 0
+        self.soma_ns: int = 0
+        self.baldes: List[int] = [0] * total_baldes
+
+    @property
+    def chamadas(self: object) -> int:
+        return sum(self.baldes)
+
+
+class Metricas:
+    """
+    Registro de métricas por operação: número de chamadas, erros
+    (exceções) e histograma de latência.
+
+    O decorator `instrumentar` custa duas leituras de relógio e alguns
+    incrementos por chamada, abaixo de um microssegundo. Os contadores
+    não usam trava: com várias threads, incrementos simultâneos da mesma
+    operação podem, raramente, se perder.
+    """
+
+    TOTAL_BALDES = 32  # durações a partir de 2**30 ns (~1,07 s) caem no último balde, +Inf
+
+    def __init__(self: object, prefixo: str = "banco") -> None:
+        self._prefixo = prefixo
+        self._operacoes: Dict[str, EstatisticasOperacao] = {}
+
+    def _estatisticas(self: object, nome: str) -> EstatisticasOperacao:
+        return self._operacoes.setdefault(nome, EstatisticasOperacao(self.TOTAL_BALDES))
+
+    def instrumentar(self: object, nome: Union[str, None] = None) -> Callable[[Callable], Callable]:
+        """Decorator que mede a função sob `nome` (padrão: o nome da função)."""
+
+        def decorador(func: Callable) -> Callable:
+            estatisticas = self._estatisticas(nome or func.__name__)
+            baldes = estatisticas.baldes
+            ultimo = len(baldes) - 1
+            maximo = 2**ultimo
+            relogio = time.perf_counter_ns
+
+            def registrar(duracao: int) -> None:
+                estatisticas.soma_ns += duracao
+                baldes[duracao.bit_length() if duracao < maximo else ultimo] += 1
+
+            # Caminho de sucesso sem chamadas auxiliares nem bloco finally:
+            # cada operação a menos conta no orçamento de um microssegundo.
+            @functools.wraps(func)
+            def envelope(*args, **kwargs):
+                inicio = relogio()
+                try:
+                    resultado = func(*args, **kwargs)
+                except BaseException:
+                    estatisticas.erros += 1
+                    registrar(relogio() - inicio)
+                    raise
+                duracao = relogio() - inicio
+                estatisticas.soma_ns += duracao
+                baldes[duracao.bit_length() if duracao < maximo else ultimo] += 1
+                return resultado
+
+            return envelope
+
+        return decorador
+
+    def snapshot(self: object) -> Dict[str, dict]:
+        """
+        Cópia das métricas em memória, por operação: chamadas, erros,
+        soma das durações em segundos e baldes cumulativos como pares
+        (limite superior em segundos, quantidade), no estilo Prometheus.
+        """
+        fotografia = {}
+        for nome, estatisticas in self._operacoes.items():
+            acumulado = 0
+            baldes = []
+            for indice, quantidade in enumerate(estatisticas.baldes[:-1]):
+                acumulado += quantidade
+                baldes.append((2**indice / 1e9, acumulado))
+            baldes.append((float("inf"), acumulado + estatisticas.baldes[-1]))
+            fotografia[nome] = {
+                "chamadas": estatisticas.chamadas,
+                "erros": estatisticas.erros,
+                "soma_segundos": estatisticas.soma_ns / 1e9,
+                "baldes": baldes,
+            }
+        return fotografia
+
+    def formatar_prometheus(self: object) -> str:
+        """Métricas no formato de texto de exposição do Prometheus."""
+        duracao = f"{self._prefixo}_operacao_duracao_segundos"
+        erros = f"{self._prefixo}_operacao_erros_total"
+        fotografia = self.snapshot()
+
+        linhas = [
+            f"# HELP {duracao} Duração das operações instrumentadas.",
+            f"# TYPE {duracao} histogram",
+        ]
+        for nome, dados in fotografia.items():
+            for limite, quantidade in dados["baldes"]:
+                le = "+Inf" if limite == float("inf") else repr(limite)
+                linhas.append(f'{duracao}_bucket{{operacao="{nome}",le="{le}"}} {quantidade}')
+            linhas.append(f'{duracao}_sum{{operacao="{nome}"}} {dados["soma_segundos"]!r}')
+            linhas.append(f'{duracao}_count{{operacao="{nome}"}} {dados["chamadas"]}')
+
+        linhas += [f"# HELP {erros} Operações encerradas com exceção.", f"# TYPE {erros} counter"]
+        for nome, dados in fotografia.items():
+            linhas.append(f'{erros}{{operacao="{nome}"}} {dados["erros"]}')
+        return "\n".join(linhas) + "\n"
+
+    def exportar_prometheus(self: object, caminho: Path) -> None:
+        """
+        Grava as métricas em `caminho` de forma atômica (arquivo temporário
+        + rename), como espera o coletor textfile do node_exporter.
+        """
+        caminho = Path(caminho)
+        caminho.parent.mkdir(parents=True, exist_ok=True)
+        temporario = caminho.with_suffix(".tmp")
+        temporario.write_text(self.formatar_prometheus(), encoding="utf-8")
+        temporario.replace(caminho)
@@ -0,0 +1,130 @@
+import json
+import os
+import pickle
+import threading
+from pathlib import Path
+from typing import Iterator, Union
+
+
+class Armazenamento:
+    """
+    Persiste o estado do banco em um diretório com dois arquivos:
+
+    - diario.jsonl: journal append-only, um evento JSON por linha, cada um
+      com um número de sequência crescente ("seq");
+    - snapshot.bin: fotografia binária (pickle) do estado completo, com a
+      sequência do último evento que ela já contempla.
+
+    Na inicialização basta carregar o snapshot e reaplicar os eventos do
+    diário posteriores a ele.
+    """
+
+    def __init__(self: object, diretorio: Path, intervalo_snapshot: int = 1000, sincronizar: bool = True) -> None:
+        self._diretorio = Path(diretorio)
+        self._diretorio.mkdir(parents=True, exist_ok=True)
+        self._caminho_diario = self._diretorio / "diario.jsonl"
+        self._caminho_snapshot = self._diretorio / "snapshot.bin"
+        self._intervalo_snapshot = intervalo_snapshot
+        self._sincronizar = sincronizar
+        self._seq = 0
+        self._seq_snapshot = 0
+        self._fim_valido: Union[int, None] = None
+        self._arquivo = None
+        # Protege a troca do arquivo do diário contra um `sincronizar` em outra thread.
+        self._trava_arquivo = threading.Lock()
+
+    @property
+    def seq(self: object) -> int:
+        return self._seq
+
+    def carregar_snapshot(self: object) -> Union[dict, None]:
+        """Retorna o estado do último snapshot, ou None se não houver."""
+        if not self._caminho_snapshot.exists():
+            return None
+
+        with open(self._caminho_snapshot, "rb") as arquivo:
+            estado = pickle.load(arquivo)
+        self._seq = self._seq_snapshot = estado["seq"]
+        return estado
+
+    def eventos_pendentes(self: object) -> Iterator[dict]:
+        """
+        Percorre os eventos do diário posteriores ao snapshot carregado.
+        Uma última linha incompleta (queda durante a escrita) é descartada,
+        e o diário é truncado nesse ponto antes da próxima gravação.
+        """
+        if not self._caminho_diario.exists():
+            return
+
+        self._fim_valido = 0
+        with open(self._caminho_diario, "rb") as arquivo:
+            for linha in arquivo:
+                # Sem a quebra de linha, a gravação não terminou: o evento não foi confirmado.
+                if not linha.endswith(b"\n"):
+                    break
+                try:
+                    evento = json.loads(linha)
+                except json.JSONDecodeError:
+                    break
+                self._fim_valido += len(linha)
+                if evento["seq"] > self._seq_snapshot:
+                    self._seq = evento["seq"]
+                    yield evento
+
+    def _abrir_diario(self: object) -> None:
+        """Abre o diário para acréscimo, descartando antes o trecho inválido encontrado na leitura."""
+        if self._fim_valido is not None and self._caminho_diario.exists():
+            with open(self._caminho_diario, "r+b") as arquivo:
+                arquivo.truncate(self._fim_valido)
+        self._fim_valido = None
+        self._arquivo = open(self._caminho_diario, "a", encoding="utf-8")
+
+    def registrar(self: object, evento: dict) -> None:
+        """Acrescenta um evento ao diário antes de confirmar a operação."""
+        if self._arquivo is None:
+            self._abrir_diario()
+
+        self._seq += 1
+        self._arquivo.write(json.dumps({"seq": self._seq, **evento}, ensure_ascii=False) + "\n")
+        self._arquivo.flush()
+        if self._sincronizar:
+            os.fsync(self._arquivo.fileno())
+
+    def sincronizar(self: object) -> None:
+        """
+        Força para o disco os eventos já gravados. Com `sincronizar=False`,
+        permite agrupar vários eventos em um único fsync; pode ser chamado
+        de outra thread enquanto novos eventos são acrescentados.
+        """
+        with self._trava_arquivo:
+            if self._arquivo is not None:
+                os.fsync(self._arquivo.fileno())
+
+    def precisa_snapshot(self: object) -> bool:
+        return self._seq - self._seq_snapshot >= self._intervalo_snapshot
+
+    def salvar_snapshot(self: object, estado: dict) -> None:
+        """
+        Grava o snapshot de forma atômica (arquivo temporário + rename) e
+        em seguida trunca o diário, cujos eventos já estão contemplados.
+        """
+        estado = {**estado, "seq": self._seq}
+        temporario = self._caminho_snapshot.with_suffix(".tmp")
+        with open(temporario, "wb") as arquivo:
+            pickle.dump(estado, arquivo, protocol=pickle.HIGHEST_PROTOCOL)
+            arquivo.flush()
+            os.fsync(arquivo.fileno())
+        os.replace(temporario, self._caminho_snapshot)
+        self._seq_snapshot = self._seq
+
+        with self._trava_arquivo:
+            if self._arquivo is not None:
+                self._arquivo.close()
+            self._fim_valido = None
+            self._arquivo = open(self._caminho_diario, "w", encoding="utf-8")
+
+    def fechar(self: object) -> None:
+        with self._trava_arquivo:
+            if self._arquivo is not None:
+                self._arquivo.close()
+                self._arquivo = None
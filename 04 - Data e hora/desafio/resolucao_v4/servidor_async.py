@@ -0,0 +1,226 @@
+"""
+Fachada assíncrona (asyncio) sobre o domínio bancário e um servidor que
+atende muitas sessões simultâneas em um único processo e thread.
+
+Protocolo: uma requisição JSON por linha, uma resposta JSON por linha.
+
+    {"op": "depositar", "conta": 1, "valor": "100.00"}
+    {"op": "sacar", "conta": 1, "valor": "50"}
+    {"op": "transferir", "origem": 1, "destino": 2, "valor": "10.5"}
+    {"op": "extrato", "conta": 1, "pagina": 1, "tamanho_pagina": 50}
+    {"op": "saldo", "conta": 1}
+
+Resposta: {"ok": true, ...} ou {"ok": false, "erro": "..."}.
+
+Uso: python servidor_async.py [--host 127.0.0.1] [--porta 8765] [--unix CAMINHO]
+"""
+import argparse
+import asyncio
+import json
+import logging
+from typing import Union
+
+from desafio_v4 import (
+    ROOT_PATH,
+    Conta,
+    Deposito,
+    Dinheiro,
+    RegistroClientes,
+    Resultado,
+    Saque,
+    motor_transferencias,
+)
+from persistencia import Armazenamento
+
+BACKLOG = 4096
+
+logger = logging.getLogger(__name__)
+
+
+class ConfirmacaoEmGrupo:
+    """
+    Confirmação em grupo (group commit) do diário: as sessões que gravaram
+    eventos aguardam o mesmo fsync, executado em uma thread, e o laço de
+    eventos segue atendendo as demais. Eventos gravados durante um fsync
+    entram no seguinte. Use com um Armazenamento criado com sincronizar=False.
+    """
+
+    def __init__(self: object, armazenamento: Armazenamento) -> None:
+        self._armazenamento = armazenamento
+        self._proxima: Union[asyncio.Future, None] = None
+        self._tarefa: Union[asyncio.Task, None] = None
+
+    async def confirmar(self: object) -> None:
+        """Retorna quando os eventos gravados até agora estiverem no disco."""
+        if self._proxima is None:
+            self._proxima = asyncio.get_running_loop().create_future()
+        proxima = self._proxima
+        if self._tarefa is None:
+            self._tarefa = asyncio.create_task(self._sincronizar())
+        await asyncio.shield(proxima)
+
+    async def _sincronizar(self: object) -> None:
+        try:
+            while self._proxima is not None:
+                rodada, self._proxima = self._proxima, None
+                try:
+                    await asyncio.to_thread(self._armazenamento.sincronizar)
+                except Exception as erro:
+                    rodada.set_exception(erro)
+                else:
+                    rodada.set_result(None)
+        finally:
+            self._tarefa = None
+
+
+class ServicoBancario:
+    """
+    Fachada assíncrona sobre Cliente, ContaCorrente e Historico.
+
+    Todas as sessões rodam no mesmo laço de eventos e as operações do
+    domínio não contêm pontos de espera, então cada operação é executada
+    por inteiro antes de outra sessão prosseguir, sem travas adicionais.
+    Com `confirmacao`, cada resposta de operação que altera contas só é
+    enviada depois que o diário estiver no disco.
+    """
+
+    def __init__(self: object, registro: RegistroClientes, confirmacao: Union[ConfirmacaoEmGrupo, None] = None) -> None:
+        self._registro = registro
+        self._confirmacao = confirmacao
+
+    async def _confirmar(self: object) -> None:
+        if self._confirmacao is not None:
+            await self._confirmacao.confirmar()
+
+    def _conta(self: object, numero: int) -> Conta:
+        conta = self._registro.buscar_conta(numero)
+        if conta is None:
+            raise LookupError(f"Conta {numero} não encontrada.")
+        return conta
+
+    def _resposta(self: object, resultado: Resultado, conta: Conta) -> dict:
+        return {"ok": bool(resultado), "resultado": resultado.name, "saldo": str(conta.saldo)}
+
+    async def depositar(self: object, numero: int, valor: Union[str, Dinheiro]) -> dict:
+        conta = self._conta(numero)
+        resultado = conta.cliente.realizar_transacao(conta, Deposito(Dinheiro.de_reais(valor)))
+        self._registro.registrar_movimento(conta)
+        resposta = self._resposta(resultado, conta)
+        await self._confirmar()
+        return resposta
+
+    async def sacar(self: object, numero: int, valor: Union[str, Dinheiro]) -> dict:
+        conta = self._conta(numero)
+        resultado = conta.cliente.realizar_transacao(conta, Saque(Dinheiro.de_reais(valor)))
+        self._registro.registrar_movimento(conta)
+        resposta = self._resposta(resultado, conta)
+        await self._confirmar()
+        return resposta
+
+    async def transferir(self: object, origem: int, destino: int, valor: Union[str, Dinheiro]) -> dict:
+        conta_origem, conta_destino = self._conta(origem), self._conta(destino)
+        resultado = motor_transferencias.transferir(conta_origem, conta_destino, Dinheiro.de_reais(valor))
+        if resultado:
+            self._registro.registrar_movimento(conta_origem)
+            self._registro.registrar_movimento(conta_destino)
+        resposta = self._resposta(resultado, conta_origem)
+        await self._confirmar()
+        return resposta
+
+    async def saldo(self: object, numero: int) -> dict:
+        return {"ok": True, "saldo": str(self._conta(numero).saldo)}
+
+    async def extrato(self: object, numero: int, pagina: int = 1, tamanho_pagina: int = 50) -> dict:
+        for parametro in (pagina, tamanho_pagina):
+            if not isinstance(parametro, int) or isinstance(parametro, bool) or parametro < 1:
+                raise ValueError("pagina e tamanho_pagina devem ser inteiros maiores que zero.")
+        conta = self._conta(numero)
+        transacoes = [
+            {"tipo": transacao["tipo"], "valor": str(transacao["valor"]), "data": transacao["data"]}
+            for transacao in conta.historico.gerar_relatorio(
+                deslocamento=(pagina - 1) * tamanho_pagina, limite=tamanho_pagina
+            )
+        ]
+        return {"ok": True, "transacoes": transacoes, "saldo": str(conta.saldo)}
+
+    async def executar(self: object, requisicao: dict) -> dict:
+        """Despacha uma requisição do protocolo para a operação correspondente."""
+        if not isinstance(requisicao, dict):
+            raise TypeError("A requisição deve ser um objeto JSON.")
+        operacao = requisicao.get("op")
+        if operacao == "depositar":
+            return await self.depositar(requisicao["conta"], requisicao["valor"])
+        if operacao == "sacar":
+            return await self.sacar(requisicao["conta"], requisicao["valor"])
+        if operacao == "transferir":
+            return await self.transferir(requisicao["origem"], requisicao["destino"], requisicao["valor"])
+        if operacao == "saldo":
+            return await self.saldo(requisicao["conta"])
+        if operacao == "extrato":
+            return await self.extrato(
+                requisicao["conta"], requisicao.get("pagina", 1), requisicao.get("tamanho_pagina", 50)
+            )
+        raise ValueError(f"Operação desconhecida: {operacao}")
+
+
+async def atender_sessao(
+    servico: ServicoBancario, leitor: asyncio.StreamReader, escritor: asyncio.StreamWriter
+) -> None:
+    """
+    Atende uma sessão de caixa: lê requisições linha a linha até o cliente
+    desconectar. Uma requisição que falha recebe {"ok": false, "erro": ...}
+    e a sessão continua; erros inesperados também são registrados no log.
+    """
+    try:
+        while linha := await leitor.readline():
+            try:
+                resposta = await servico.executar(json.loads(linha))
+            except (KeyError, LookupError, TypeError, ValueError) as erro:
+                resposta = {"ok": False, "erro": str(erro)}
+            except Exception as erro:
+                logger.exception("Falha ao processar a requisição %r", linha)
+                resposta = {"ok": False, "erro": f"Erro interno: {type(erro).__name__}"}
+            escritor.write(json.dumps(resposta, ensure_ascii=False).encode() + b"\n")
+            await escritor.drain()
+    except ConnectionError:
+        pass
+    finally:
+        escritor.close()
+
+
+async def servir(
+    servico: ServicoBancario, host: str = "127.0.0.1", porta: int = 8765, unix: Union[str, None] = None
+) -> None:
+    async def sessao(leitor: asyncio.StreamReader, escritor: asyncio.StreamWriter) -> None:
+        await atender_sessao(servico, leitor, escritor)
+
+    if unix:
+        servidor = await asyncio.start_unix_server(sessao, path=unix, backlog=BACKLOG)
+    else:
+        servidor = await asyncio.start_server(sessao, host, porta, backlog=BACKLOG)
+
+    async with servidor:
+        await servidor.serve_forever()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Servidor assíncrono do banco.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--porta", type=int, default=8765)
+    parser.add_argument("--unix", help="caminho de um socket Unix, no lugar de TCP")
+    argumentos = parser.parse_args()
+
+    # O fsync de cada evento fica a cargo da confirmação em grupo, fora do laço de eventos.
+    armazenamento = Armazenamento(ROOT_PATH / "dados", sincronizar=False)
+    registro = RegistroClientes.restaurar(armazenamento)
+    servico = ServicoBancario(registro, ConfirmacaoEmGrupo(armazenamento))
+    try:
+        asyncio.run(servir(servico, argumentos.host, argumentos.porta, argumentos.unix))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        registro.fechar()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Os módulos do desafio são arquivos soltos, importados pelo nome (ex.: `from desafio_v4 import ...`).
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
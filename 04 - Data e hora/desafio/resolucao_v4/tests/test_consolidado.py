@@ -0,0 +1,45 @@
+from datetime import date, datetime, timedelta
+
+from desafio_v4 import ContaCorrente, Dinheiro, Historico, PessoaFisica
+
+
+def _historico_com_saques() -> Historico:
+    cliente = PessoaFisica("Ana", "01-01-1990", "12345678901", "Rua 1")
+    historico = ContaCorrente(1, cliente).historico
+    ontem = datetime.combine(date.today() - timedelta(days=1), datetime.min.time())
+    for tipo, centavos, horas in (("Depósito", 10_000, 1), ("Saque", 1_000, 2), ("Saque", 500, 30)):
+        historico.restaurar_transacao(tipo, centavos, int((ontem + timedelta(hours=horas)).timestamp()))
+    return historico
+
+
+def test_estatisticas_de_saques_leem_o_consolidado():
+    # Given
+    historico = _historico_com_saques()
+    ontem, hoje = date.today() - timedelta(days=1), date.today()
+
+    # When
+    saques, consolidado = historico.saques, historico.consolidado
+
+    # Then
+    assert saques.quantidade == 2
+    assert saques.total == Dinheiro(1_500)
+    assert saques.do_dia(ontem) == (1, Dinheiro(1_000))
+    assert saques.do_dia(hoje) == (1, Dinheiro(500))
+    assert saques.no_periodo(ontem, hoje) == (2, Dinheiro(1_500))
+    assert consolidado.no_periodo(ontem, hoje).saques == saques.total
+    assert saques.do_mes(hoje.year, hoje.month)[1] == consolidado.do_mes(hoje.year, hoje.month).saques
+
+
+def test_importar_colunas_preserva_estatisticas_de_saques():
+    # Given
+    original = _historico_com_saques()
+    colunas = original.exportar_colunas()
+
+    # When
+    restaurado = Historico()
+    restaurado.importar_colunas(list(Historico._tipos_conhecidos), *colunas)
+
+    # Then
+    assert restaurado.saques.quantidade == 2
+    assert restaurado.saques.total == Dinheiro(1_500)
+    assert restaurado.saques.do_dia(date.today()) == (1, Dinheiro(500))
@@ -0,0 +1,37 @@
+import operator
+
+import pytest
+
+from desafio_v4 import Dinheiro
+
+
+@pytest.mark.parametrize(
+    "operacao", [operator.add, operator.sub, operator.lt, operator.le, operator.gt, operator.ge]
+)
+def test_operacoes_com_outro_tipo_levantam_type_error(operacao):
+    # Given
+    valor = Dinheiro(100)
+
+    # When / Then
+    with pytest.raises(TypeError):
+        operacao(valor, 0)
+    with pytest.raises(TypeError):
+        operacao(0, valor)
+
+
+def test_operacoes_entre_dinheiro():
+    # Given
+    dez, um = Dinheiro.de_reais(10), Dinheiro(100)
+
+    # When / Then
+    assert dez + um == Dinheiro(1100)
+    assert dez - um == Dinheiro(900)
+    assert um < dez <= dez and dez > um >= um
+    assert Dinheiro(100) != 100
+
+
+def test_de_reais_recusa_valor_fora_do_limite():
+    # When / Then
+    with pytest.raises(ValueError, match="fora do limite"):
+        Dinheiro.de_reais("1e20")
+    assert Dinheiro.de_reais(Dinheiro.MAXIMO_CENTAVOS // 100).centavos <= Dinheiro.MAXIMO_CENTAVOS
@@ -0,0 +1,48 @@
+import io
+
+import pytest
+
+from desafio_v4 import ContaCorrente, Deposito, PessoaFisica, escrever_extrato
+
+
+@pytest.fixture
+def conta() -> ContaCorrente:
+    cliente = PessoaFisica("Ana", "01-01-1990", "12345678901", "Rua 1")
+    conta = ContaCorrente(1, cliente)
+    cliente.adicionar_conta(conta)
+    cliente.limite_transacoes_diarias = 100
+    for valor in range(1, 6):
+        assert cliente.realizar_transacao(conta, Deposito(valor))
+    return conta
+
+
+@pytest.mark.parametrize("parametros", [{"deslocamento": -1}, {"limite": -1}])
+def test_gerar_relatorio_recusa_paginacao_negativa(conta, parametros):
+    # When / Then
+    with pytest.raises(ValueError):
+        conta.historico.gerar_relatorio(**parametros)
+    with pytest.raises(ValueError):
+        conta.historico.gerar_relatorio("Depósito", **parametros)
+
+
+@pytest.mark.parametrize("pagina,tamanho_pagina", [(0, 2), (-1, 2), (1, 0)])
+def test_escrever_extrato_recusa_pagina_invalida(conta, pagina, tamanho_pagina):
+    # Given
+    saida = io.StringIO()
+
+    # When / Then
+    with pytest.raises(ValueError):
+        escrever_extrato(conta, saida, pagina=pagina, tamanho_pagina=tamanho_pagina)
+    assert saida.getvalue() == ""
+
+
+def test_escrever_extrato_pagina(conta):
+    # Given
+    saida = io.StringIO()
+
+    # When
+    escrever_extrato(conta, saida, pagina=3, tamanho_pagina=2)
+
+    # Then
+    assert saida.getvalue().count("Depósito - R$") == 1
+    assert "R$ 5.00 em" in saida.getvalue()
@@ -0,0 +1,73 @@
+import pytest
+
+from livro_particionado import LivroParticionado
+
+
+def test_falha_em_uma_particao_nao_trava_o_livro():
+    with LivroParticionado(2) as livro:
+        # Given
+        livro.abrir_contas([(1, "12345678901", "Ana"), (2, "10987654321", "Bruno")])
+
+        # When / Then
+        with pytest.raises(RuntimeError, match="Já existe conta com esse número"):
+            livro.abrir_contas([(1, "12345678901", "Ana")])
+        with pytest.raises(RuntimeError, match="Operação desconhecida"):
+            livro._exigir({0: [("inexistente",)]})
+
+        assert livro.executar([("Depósito", 2, 1_000)]).tolist() == [0]
+        assert livro.saldo(2).centavos == 1_000
+
+
+def test_particao_encerrada_levanta_erro():
+    with LivroParticionado(2) as livro:
+        # Given
+        livro._processos[1].terminate()
+        livro._processos[1].join()
+
+        # When / Then
+        with pytest.raises(RuntimeError, match="encerrou sem responder"):
+            livro.saldo(1)
+
+
+def test_operacao_mal_formada_e_recusada_antes_do_envio():
+    with LivroParticionado(2) as livro:
+        # Given
+        livro.abrir_contas([(1, "12345678901", "Ana"), (2, "10987654321", "Bruno")])
+        livro.executar([("Depósito", 1, 10_000)])
+
+        # When / Then
+        with pytest.raises(ValueError, match="posição 1"):
+            livro.executar([("Transferência", 1, 2, 5_000), ("Saque", 2, "abc")])
+        assert livro.saldo(1).centavos == 10_000
+        assert livro.saldo(2).centavos == 0
+
+
+def test_falha_na_primeira_fase_estorna_as_reservas():
+    with LivroParticionado(2) as livro:
+        # Given
+        livro.abrir_contas([(1, "12345678901", "Ana"), (2, "10987654321", "Bruno"), (4, "11122233344", "Caio")])
+        livro.executar([("Depósito", 1, 10_000), ("Depósito", 2, 2_000)])
+
+        # When
+        with pytest.raises(RuntimeError, match="Partição 0"):
+            livro.executar([("Transferência", 1, 2, 5_000), ("Saque", 4, 100, -(10**20))])
+
+        # Then
+        assert livro.saldo(1).centavos + livro.saldo(2).centavos == 12_000
+        assert livro.saldo(1).centavos == 10_000
+
+
+def test_falha_na_fase_de_credito_estorna_as_reservas():
+    with LivroParticionado(2) as livro:
+        # Given
+        livro.abrir_contas([(1, "12345678901", "Ana"), (2, "10987654321", "Bruno")])
+        livro.executar([("Depósito", 1, 10_000)])
+        livro._processos[0].terminate()
+        livro._processos[0].join()
+
+        # When
+        with pytest.raises(RuntimeError, match="encerrou sem responder"):
+            livro.executar([("Transferência", 1, 2, 5_000)])
+
+        # Then
+        assert livro.saldo(1).centavos == 10_000
@@ -0,0 +1,72 @@
+from datetime import date, datetime, timedelta
+
+from desafio_v4 import ContaCorrente, Deposito, Dinheiro, PessoaFisica, Resultado
+from lote import aplicar_lote
+
+
+def _conta() -> ContaCorrente:
+    cliente = PessoaFisica("Ana", "01-01-1990", "12345678901", "Rua 1")
+    conta = ContaCorrente(1, cliente)
+    cliente.adicionar_conta(conta)
+    return conta
+
+
+def test_recusa_linha_anterior_ao_historico():
+    # Given
+    conta = _conta()
+    assert conta.cliente.realizar_transacao(conta, Deposito(100))
+    antiga = datetime.now() - timedelta(days=40)
+
+    # When
+    resultados = aplicar_lote([(conta, "Depósito", Dinheiro(5000), antiga)])
+
+    # Then
+    assert list(resultados) == [Resultado.DATA_FORA_DE_ORDEM]
+    assert conta.saldo == Dinheiro.de_reais(100)
+    assert conta.historico.quantidade_no_periodo(date.today() - timedelta(days=30), date.today() + timedelta(1)) == 1
+    assert conta.historico.quantidade_do_dia() == 1
+
+
+def test_aceita_linhas_em_ordem_apos_o_historico():
+    # Given
+    conta = _conta()
+    inicio = datetime.now() - timedelta(days=40)
+    linhas = [
+        (conta, "Depósito", Dinheiro(10_000), inicio),
+        (conta, "Saque", Dinheiro(2_500), inicio + timedelta(days=1)),
+        (conta, "Depósito", Dinheiro(1_000), inicio),
+    ]
+
+    # When
+    resultados = aplicar_lote(linhas)
+
+    # Then
+    assert list(resultados) == [Resultado.ACEITA, Resultado.ACEITA, Resultado.DATA_FORA_DE_ORDEM]
+    assert conta.saldo == Dinheiro(7_500)
+
+
+def test_recusa_valor_que_nao_e_dinheiro():
+    # Given
+    conta = _conta()
+
+    # When
+    resultados = aplicar_lote([(conta, "Depósito", 100, datetime.now())])
+
+    # Then
+    assert list(resultados) == [Resultado.VALOR_INVALIDO]
+    assert conta.saldo == Dinheiro()
+
+
+def test_recusa_linha_com_data_futura():
+    # Given
+    conta = _conta()
+    futura = datetime.now() + timedelta(days=30)
+
+    # When
+    resultados = aplicar_lote([(conta, "Depósito", Dinheiro(5000), futura)])
+    depositos = [conta.cliente.realizar_transacao(conta, Deposito(valor)) for valor in range(1, 15)]
+
+    # Then
+    assert list(resultados) == [Resultado.DATA_FUTURA]
+    assert depositos.count(Resultado.ACEITA) == conta.cliente.limite_transacoes_diarias
+    assert max(conta.historico._datas) <= datetime.now().timestamp()
@@ -0,0 +1,91 @@
+from desafio_v4 import Conta, ContaCorrente, Deposito, PessoaFisica, RegistroClientes
+from persistencia import Armazenamento
+
+
+def _cair(registro: RegistroClientes) -> None:
+    """Simula a queda do processo: o diário é largado sem snapshot final."""
+    registro._armazenamento.fechar()
+
+
+def _depositar(registro: RegistroClientes, numero: int, valor: float) -> None:
+    conta = registro.buscar_conta(numero)
+    assert conta.cliente.realizar_transacao(conta, Deposito(valor))
+    registro.registrar_movimento(conta)
+
+
+def test_restaurar_descarta_linha_incompleta_e_preserva_eventos_seguintes(tmp_path):
+    # Given
+    registro = RegistroClientes.restaurar(Armazenamento(tmp_path))
+    cliente = PessoaFisica("Ana", "01-01-1990", "12345678901", "Rua 1")
+    registro.adicionar(cliente)
+    registro.registrar_conta(ContaCorrente(1, cliente))
+    _depositar(registro, 1, 100)
+    _cair(registro)
+    with open(tmp_path / "diario.jsonl", "a", encoding="utf-8") as diario:
+        diario.write('{"seq": 4, "evento": "movim')
+
+    # When
+    registro = RegistroClientes.restaurar(Armazenamento(tmp_path))
+    _depositar(registro, 1, 50)
+    registro.adicionar(PessoaFisica("Bruno", "02-02-1990", "10987654321", "Rua 2"))
+    _cair(registro)
+    registro = RegistroClientes.restaurar(Armazenamento(tmp_path))
+
+    # Then
+    assert registro.buscar_conta(1).saldo.centavos == 150_00
+    assert len(registro.buscar_conta(1).historico.transacoes) == 2
+    assert "10987654321" in registro
+
+
+def test_restaurar_descarta_linha_sem_quebra_final(tmp_path):
+    # Given
+    registro = RegistroClientes.restaurar(Armazenamento(tmp_path))
+    registro.adicionar(PessoaFisica("Ana", "01-01-1990", "12345678901", "Rua 1"))
+    _cair(registro)
+    with open(tmp_path / "diario.jsonl", "a", encoding="utf-8") as diario:
+        diario.write('{"seq": 2, "evento": "cliente", "nome": "Eva", "data_nascimento": "", '
+                     '"cpf": "11111111111", "endereco": ""}')
+
+    # When
+    registro = RegistroClientes.restaurar(Armazenamento(tmp_path))
+    registro.adicionar(PessoaFisica("Bruno", "02-02-1990", "10987654321", "Rua 2"))
+    _cair(registro)
+    registro = RegistroClientes.restaurar(Armazenamento(tmp_path))
+
+    # Then
+    assert "11111111111" not in registro
+    assert "10987654321" in registro
+
+
+def test_registrar_conta_simples_sem_armazenamento():
+    # Given
+    registro = RegistroClientes()
+    cliente = PessoaFisica("Ana", "01-01-1990", "12345678901", "Rua 1")
+    registro.adicionar(cliente)
+
+    # When
+    registro.registrar_conta(Conta(1, cliente))
+
+    # Then
+    assert registro.buscar_conta(1).cliente is cliente
+
+
+def test_restaurar_conta_simples(tmp_path):
+    # Given
+    registro = RegistroClientes.restaurar(Armazenamento(tmp_path))
+    cliente = PessoaFisica("Ana", "01-01-1990", "12345678901", "Rua 1")
+    registro.adicionar(cliente)
+    registro.registrar_conta(Conta(1, cliente))
+    registro.registrar_conta(ContaCorrente(2, cliente, limite=800, limite_saques=5))
+    _cair(registro)
+
+    # When
+    pelo_diario = RegistroClientes.restaurar(Armazenamento(tmp_path))
+    pelo_diario.fechar()
+    pelo_snapshot = RegistroClientes.restaurar(Armazenamento(tmp_path))
+
+    # Then
+    for registro in (pelo_diario, pelo_snapshot):
+        assert type(registro.buscar_conta(1)) is Conta
+        assert registro.buscar_conta(2)._limite.centavos == 800_00
+        assert registro.buscar_conta(2)._limite_saques == 5
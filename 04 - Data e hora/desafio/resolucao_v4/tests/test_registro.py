@@ -0,0 +1,36 @@
+from desafio_v4 import PessoaFisica, RegistroClientes
+from persistencia import Armazenamento
+
+
+def _cliente(nome: str, cpf: int) -> PessoaFisica:
+    return PessoaFisica(nome, "01-01-1990", f"{cpf:011d}", "Rua 1")
+
+
+def test_buscar_por_nome_apos_cadastros_intercalados():
+    # Given
+    registro = RegistroClientes()
+    registro.adicionar(_cliente("Bruno", 1))
+    registro.adicionar(_cliente("Ana", 2))
+    assert [cliente.nome for cliente in registro.buscar_por_nome("b")] == ["Bruno"]
+
+    # When
+    registro.adicionar(_cliente("Beatriz", 3))
+    registro.adicionar(_cliente("bianca", 4))
+
+    # Then
+    assert [cliente.nome for cliente in registro.buscar_por_nome("B")] == ["Beatriz", "bianca", "Bruno"]
+    assert [cliente.nome for cliente in registro.buscar_por_nome("an")] == ["Ana"]
+
+
+def test_buscar_por_nome_apos_restaurar_snapshot(tmp_path):
+    # Given
+    registro = RegistroClientes.restaurar(Armazenamento(tmp_path))
+    for cpf, nome in enumerate(["Carla", "Ana", "Caio", "Bruno"], start=1):
+        registro.adicionar(_cliente(nome, cpf))
+    registro.fechar()
+
+    # When
+    restaurado = RegistroClientes.restaurar(Armazenamento(tmp_path))
+
+    # Then
+    assert [cliente.nome for cliente in restaurado.buscar_por_nome("ca")] == ["Caio", "Carla"]
@@ -0,0 +1,118 @@
+import asyncio
+import json
+
+from desafio_v4 import ContaCorrente, PessoaFisica, RegistroClientes
+from persistencia import Armazenamento
+from servidor_async import ConfirmacaoEmGrupo, ServicoBancario, atender_sessao
+
+
+def _servico(tmp_path) -> ServicoBancario:
+    armazenamento = Armazenamento(tmp_path, sincronizar=False)
+    registro = RegistroClientes.restaurar(armazenamento)
+    cliente = PessoaFisica("Ana", "01-01-1990", "12345678901", "Rua 1")
+    cliente.limite_transacoes_diarias = 1_000
+    registro.adicionar(cliente)
+    registro.registrar_conta(ContaCorrente(1, cliente))
+    return ServicoBancario(registro, ConfirmacaoEmGrupo(armazenamento))
+
+
+async def _sessao(servico: ServicoBancario, linhas: list) -> list:
+    """Atende uma sessão com as linhas informadas e retorna as respostas."""
+    respostas = []
+
+    async def conectar(leitor, escritor):
+        await atender_sessao(servico, leitor, escritor)
+
+    servidor = await asyncio.start_server(conectar, "127.0.0.1", 0)
+    async with servidor:
+        leitor, escritor = await asyncio.open_connection(*servidor.sockets[0].getsockname()[:2])
+        for linha in linhas:
+            escritor.write(linha.encode() + b"\n")
+            await escritor.drain()
+            respostas.append(json.loads(await leitor.readline()))
+        escritor.close()
+    return respostas
+
+
+def test_requisicao_que_nao_e_objeto_nao_encerra_a_sessao(tmp_path):
+    # Given
+    servico = _servico(tmp_path)
+
+    # When
+    respostas = asyncio.run(_sessao(servico, ["[1]", '"texto"', '{"op": "saldo", "conta": 1}']))
+
+    # Then
+    assert [resposta["ok"] for resposta in respostas] == [False, False, True]
+
+
+def test_extrato_recusa_pagina_invalida(tmp_path):
+    # Given
+    servico = _servico(tmp_path)
+    linhas = [
+        '{"op": "depositar", "conta": 1, "valor": "10"}',
+        '{"op": "extrato", "conta": 1, "pagina": 0}',
+        '{"op": "extrato", "conta": 1, "pagina": -1}',
+        '{"op": "extrato", "conta": 1, "tamanho_pagina": 0}',
+        '{"op": "extrato", "conta": 1, "pagina": 1}',
+    ]
+
+    # When
+    respostas = asyncio.run(_sessao(servico, linhas))
+
+    # Then
+    assert [resposta["ok"] for resposta in respostas] == [True, False, False, False, True]
+    assert len(respostas[-1]["transacoes"]) == 1
+
+
+def test_operacoes_simultaneas_compartilham_o_fsync(tmp_path, monkeypatch):
+    # Given
+    servico = _servico(tmp_path)
+    sincronizacoes = []
+    armazenamento = servico._registro._armazenamento
+    original = armazenamento.sincronizar
+    monkeypatch.setattr(armazenamento, "sincronizar", lambda: (sincronizacoes.append(1), original()))
+
+    async def depositar_varias():
+        return await asyncio.gather(*(servico.depositar(1, str(valor)) for valor in range(1, 101)))
+
+    # When
+    respostas = asyncio.run(depositar_varias())
+
+    # Then
+    assert all(resposta["ok"] for resposta in respostas)
+    assert 1 <= len(sincronizacoes) < len(respostas)
+    restaurado = RegistroClientes.restaurar(Armazenamento(tmp_path))
+    assert restaurado.buscar_conta(1).saldo.centavos == sum(range(1, 101)) * 100
+
+
+def test_valor_fora_do_limite_nao_encerra_a_sessao(tmp_path):
+    # Given
+    servico = _servico(tmp_path)
+    linhas = ['{"op": "depositar", "conta": 1, "valor": "1e20"}', '{"op": "saldo", "conta": 1}']
+
+    # When
+    respostas = asyncio.run(_sessao(servico, linhas))
+
+    # Then
+    assert [resposta["ok"] for resposta in respostas] == [False, True]
+    assert respostas[1]["saldo"] == "0.00"
+
+
+def test_falha_na_confirmacao_responde_erro_e_mantem_a_sessao(tmp_path, monkeypatch, caplog):
+    # Given
+    servico = _servico(tmp_path)
+    armazenamento = servico._registro._armazenamento
+
+    def falhar():
+        raise OSError("disco cheio")
+
+    monkeypatch.setattr(armazenamento, "sincronizar", falhar)
+    linhas = ['{"op": "depositar", "conta": 1, "valor": "10"}', '{"op": "saldo", "conta": 1}']
+
+    # When
+    respostas = asyncio.run(_sessao(servico, linhas))
+
+    # Then
+    assert respostas[0] == {"ok": False, "erro": "Erro interno: OSError"}
+    assert respostas[1]["ok"]
+    assert "disco cheio" in caplog.text
@@ -0,0 +1,109 @@
+from datetime import datetime
+
+import pytest
+
+from desafio_v4 import ContaCorrente, Deposito, Dinheiro, PessoaFisica, Resultado, Saque
+
+
+def _conta(**kwargs) -> ContaCorrente:
+    cliente = PessoaFisica("Ana", "01-01-1990", "12345678901", "Rua 1")
+    conta = ContaCorrente(1, cliente, **kwargs)
+    cliente.adicionar_conta(conta)
+    return conta
+
+
+def test_deposito_duplicado_nao_altera_saldo():
+    # Given
+    conta = _conta()
+    assert conta.cliente.realizar_transacao(conta, Deposito(100))
+
+    # When
+    resultado = conta.cliente.realizar_transacao(conta, Deposito(100))
+
+    # Then
+    assert resultado == Resultado.TRANSACAO_DUPLICADA
+    assert conta.saldo == Dinheiro.de_reais(100)
+    assert len(conta.historico.transacoes) == 1
+
+
+def test_saque_duplicado_nao_debita_nem_conta_como_saque():
+    # Given
+    conta = _conta(limite_saques=3)
+    assert conta.cliente.realizar_transacao(conta, Deposito(1000))
+
+    # When
+    resultados = [conta.cliente.realizar_transacao(conta, Saque(10)) for _ in range(6)]
+
+    # Then
+    assert resultados == [Resultado.ACEITA] + [Resultado.TRANSACAO_DUPLICADA] * 5
+    assert conta.saldo == Dinheiro.de_reais(990)
+    assert conta.estatisticas_saques.quantidade == 1
+
+
+def test_limite_de_saques_vale_para_saques_distintos():
+    # Given
+    conta = _conta(limite_saques=3)
+    assert conta.cliente.realizar_transacao(conta, Deposito(1000))
+
+    # When
+    resultados = [conta.cliente.realizar_transacao(conta, Saque(valor)) for valor in (10, 11, 12, 13)]
+
+    # Then
+    assert resultados == [Resultado.ACEITA] * 3 + [Resultado.EXCEDEU_NUMERO_SAQUES]
+    assert conta.saldo == Dinheiro.de_reais(1000 - 33)
+
+
+def test_toda_recusa_preserva_saldo():
+    # Given
+    conta = _conta(limite=50, limite_saques=10)
+    assert conta.cliente.realizar_transacao(conta, Deposito(100))
+    saldo = conta.saldo
+
+    # When
+    resultados = [
+        conta.cliente.realizar_transacao(conta, transacao)
+        for transacao in (Deposito(100), Saque(60), Saque(0), Saque(90.5))
+    ]
+
+    # Then
+    assert all(not resultado for resultado in resultados)
+    assert conta.saldo == saldo
+
+
+def test_historico_recusa_data_fora_de_ordem():
+    # Given
+    conta = _conta()
+    agora = int(datetime.now().timestamp())
+    conta.historico.restaurar_transacao("Depósito", 100, agora)
+
+    # When / Then
+    with pytest.raises(ValueError):
+        conta.historico.restaurar_transacao("Depósito", 100, agora - 1)
+    assert len(conta.historico.transacoes) == 1
+
+
+def test_deposito_fora_do_limite_nao_altera_conta():
+    # Given
+    conta = _conta()
+    assert conta.cliente.realizar_transacao(conta, Deposito(100))
+
+    # When
+    resultado = conta.cliente.realizar_transacao(conta, Deposito(Dinheiro(10**20)))
+
+    # Then
+    assert resultado == Resultado.VALOR_INVALIDO
+    assert conta.saldo == Dinheiro.de_reais(100)
+    assert conta.historico.exportar_transacoes() == [("Depósito", 10_000, conta.historico._datas[0])]
+
+
+def test_anexar_fora_do_limite_nao_altera_colunas():
+    # Given
+    historico = _conta().historico
+    agora = int(datetime.now().timestamp())
+
+    # When / Then
+    with pytest.raises(ValueError, match="excede o limite"):
+        historico._anexar("Depósito", 1, 10**20, agora)
+    with pytest.raises((OverflowError, ValueError, OSError)):
+        historico._anexar("Depósito", 1, 100, 10**20)
+    assert len(historico._tipos) == len(historico._valores) == len(historico._datas) == 0
@@ -1,4 +1,7 @@
+import atexit
+import json
 import textwrap
+import threading
 from abc import ABC, abstractclassmethod, abstractproperty
 from datetime import datetime
 from pathlib import Path
@@ -230,15 +233,85 @@ class Deposito(Transacao):
             conta.historico.adicionar_transacao(self)
 
 
+class LogTransacoes:
+    """Mantém o arquivo de log aberto e grava os registros em lotes.
+
+    O buffer é descarregado quando atinge `tamanho_lote` linhas, a cada
+    `intervalo` segundos (thread em segundo plano) e ao encerrar o programa.
+    Com `formato="json"` cada linha é um objeto JSON (JSON Lines).
+    """
+
+    def __init__(self, caminho, formato="texto", tamanho_lote=100, intervalo=1.0):
+        if formato not in ("texto", "json"):
+            raise ValueError("Formato de log inválido, use 'texto' ou 'json'.")
+
+        self._arquivo = open(caminho, "a", encoding="utf-8")
+        self._formato = formato
+        self._tamanho_lote = tamanho_lote
+        self._intervalo = intervalo
+        self._buffer = []
+        self._lock = threading.Lock()
+        self._encerrar = threading.Event()
+        self._thread = threading.Thread(target=self._descarregar_periodicamente, daemon=True)
+        self._thread.start()
+        atexit.register(self.fechar)
+
+    def registrar(self, funcao, args, kwargs, resultado):
+        data_hora = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+        if self._formato == "json":
+            linha = json.dumps(
+                {
+                    "data_hora": data_hora,
+                    "funcao": funcao,
+                    "args": [repr(arg) for arg in args],
+                    "kwargs": {chave: repr(valor) for chave, valor in kwargs.items()},
+                    "resultado": repr(resultado),
+                },
+                ensure_ascii=False,
+            )
+        else:
+            linha = (
+                f"[{data_hora}] Função '{funcao}' executada com argumentos {args} e {kwargs}. "
+                f"Retornou {resultado}"
+            )
+
+        with self._lock:
+            self._buffer.append(linha + "\n")
+            if len(self._buffer) >= self._tamanho_lote:
+                self._gravar()
+
+    def descarregar(self):
+        with self._lock:
+            self._gravar()
+
+    def _gravar(self):
+        if self._buffer and not self._arquivo.closed:
+            self._arquivo.write("".join(self._buffer))
+            self._arquivo.flush()
+            self._buffer.clear()
+
+    def _descarregar_periodicamente(self):
+        while not self._encerrar.wait(self._intervalo):
+            self.descarregar()
+
+    def fechar(self):
+        if self._arquivo.closed:
+            return
+
+        self._encerrar.set()
+        self._thread.join()
+        with self._lock:
+            self._gravar()
+            self._arquivo.close()
+
+
+log = LogTransacoes(ROOT_PATH / "log.txt")
+
+
 def log_transacao(func):
     def envelope(*args, **kwargs):
         resultado = func(*args, **kwargs)
-        data_hora = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
-        with open(ROOT_PATH / "log.txt", "a") as arquivo:
-            arquivo.write(
-                f"[{data_hora}] Função '{func.__name__}' executada com argumentos {args} e {kwargs}. "
-                f"Retornou {resultado}\n"
-            )
+        log.registrar(func.__name__, args, kwargs, resultado)
         return resultado
 
     return envelope
@@ -1,10 +1,14 @@
-from fastapi import APIRouter, Depends, status
+from datetime import datetime
 
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+
+from src.models.transaction import TransactionType
+from src.pagination import cursor_headers, resolve_keyset
 from src.schemas.account import AccountIn
 from src.security import login_required
 from src.services.account import AccountService
 from src.services.transaction import TransactionService
-from src.views.account import AccountOut, TransactionOut
+from src.views.account import AccountOut, DailyTotalOut, TransactionOut
 
 router = APIRouter(prefix="/accounts", dependencies=[Depends(login_required)])
 
@@ -12,9 +16,27 @@ account_service = AccountService()
 tx_service = TransactionService()
 
 
+def _keyset(after_id: int | None, before_id: int | None, cursor: str | None) -> tuple[int | None, int | None]:
+    try:
+        return resolve_keyset(after_id, before_id, cursor)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+
 @router.get("/", response_model=list[AccountOut])
-async def read_accounts(limit: int, skip: int = 0):
-    return await account_service.read_all(limit=limit, skip=skip)
+async def read_accounts(
+    response: Response,
+    limit: int,
+    skip: int = 0,
+    after_id: int | None = None,
+    before_id: int | None = None,
+    cursor: str | None = None,
+):
+    after_id, before_id = _keyset(after_id, before_id, cursor)
+    accounts = await account_service.read_all(limit=limit, skip=skip, after_id=after_id, before_id=before_id)
+    paged = skip > 0 or after_id is not None
+    response.headers.update(cursor_headers(accounts, limit, paged, backwards=before_id is not None))
+    return accounts
 
 
 @router.post("/", status_code=status.HTTP_201_CREATED, response_model=AccountOut)
@@ -23,5 +45,42 @@ async def create_account(account: AccountIn):
 
 
 @router.get("/{id}/transactions", response_model=list[TransactionOut])
-async def read_account_transactions(id: int, limit: int, skip: int = 0):
-    return await tx_service.read_all(account_id=id, limit=limit, skip=skip)
+async def read_account_transactions(
+    id: int,
+    response: Response,
+    limit: int,
+    skip: int = 0,
+    after_id: int | None = None,
+    before_id: int | None = None,
+    cursor: str | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    type: TransactionType | None = None,
+    min_amount: float | None = Query(default=None, gt=0),
+):
+    after_id, before_id = _keyset(after_id, before_id, cursor)
+    transactions = await tx_service.read_all(
+        account_id=id,
+        limit=limit,
+        skip=skip,
+        after_id=after_id,
+        before_id=before_id,
+        start=start,
+        end=end,
+        type_=type,
+        min_amount=min_amount,
+    )
+    paged = skip > 0 or after_id is not None
+    response.headers.update(cursor_headers(transactions, limit, paged, backwards=before_id is not None))
+    return transactions
+
+
+@router.get("/{id}/transactions/daily", response_model=list[DailyTotalOut])
+async def read_account_daily_totals(
+    id: int,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    type: TransactionType | None = None,
+    min_amount: float | None = Query(default=None, gt=0),
+):
+    return await tx_service.read_daily_totals(account_id=id, start=start, end=end, type_=type, min_amount=min_amount)
@@ -1,15 +1,87 @@
-from fastapi import APIRouter, Depends, status
+import json
+from collections.abc import AsyncIterator
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from pydantic import ValidationError
 
 from src.schemas.transaction import TransactionIn
 from src.security import login_required
 from src.services.transaction import TransactionService
-from src.views.transaction import TransactionOut
+from src.views.transaction import TransactionOut, TransactionResultOut
 
 router = APIRouter(prefix="/transactions", dependencies=[Depends(login_required)])
 
 service = TransactionService()
 
+BATCH_CHUNK_SIZE = 1000
+
 
 @router.post("/", status_code=status.HTTP_201_CREATED, response_model=TransactionOut)
 async def create_transaction(transaction: TransactionIn):
     return await service.create(transaction)
+
+
+async def _read_items(request: Request) -> AsyncIterator[object]:
+    """
+    Yield the items of a JSON array body or, for application/x-ndjson, each raw line as it
+    arrives, so that a malformed line only invalidates its own item.
+    """
+    if "ndjson" not in request.headers.get("content-type", ""):
+        try:
+            items = json.loads(await request.body())
+        except ValueError:
+            items = None
+        if not isinstance(items, list):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Expected a JSON array.")
+        for item in items:
+            yield item
+        return
+
+    pending = b""
+    async for chunk in request.stream():
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield line
+    if pending.strip():
+        yield pending
+
+
+@router.post("/batch", response_model=list[TransactionResultOut])
+async def create_transactions_batch(request: Request):
+    """
+    Accept a JSON array or an NDJSON stream of transactions and apply them in chunks of
+    BATCH_CHUNK_SIZE, one DB transaction per chunk. Results are returned per item, in input order.
+    """
+    results: list[TransactionResultOut] = []
+    indexes: list[int] = []
+    batch: list[TransactionIn] = []
+
+    async def flush() -> None:
+        for index, detail in zip(indexes, await service.create_batch(batch)):
+            results[index] = TransactionResultOut(
+                index=index, status="rejected" if detail else "created", detail=detail
+            )
+        indexes.clear()
+        batch.clear()
+
+    async for item in _read_items(request):
+        index = len(results)
+        try:
+            if isinstance(item, bytes):
+                batch.append(TransactionIn.model_validate_json(item))
+            else:
+                batch.append(TransactionIn.model_validate(item))
+        except ValidationError as exc:
+            results.append(TransactionResultOut(index=index, status="invalid", detail=exc.errors(include_url=False)))
+            continue
+
+        results.append(None)
+        indexes.append(index)
+        if len(batch) >= BATCH_CHUNK_SIZE:
+            await flush()
+
+    if batch:
+        await flush()
+    return results
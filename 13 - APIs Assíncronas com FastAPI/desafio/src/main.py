@@ -7,6 +7,7 @@ from fastapi.responses import JSONResponse
 from src.controllers import account, auth, transaction
 from src.database import database
 from src.exceptions import AccountNotFoundError, BusinessError
+from src.pagination import NEXT_CURSOR_HEADER, PREV_CURSOR_HEADER
 
 
 @asynccontextmanager
@@ -45,9 +46,15 @@ Transactions API is the microservice for recording current account transactions.
 * **List accounts**.
 * **List account transactions by ID**.
 
+Listings are paginated by cursor: follow the `X-Next-Cursor` / `X-Prev-Cursor` response headers
+with the `cursor` query parameter, or pass `after_id` / `before_id` directly.
+Account transactions can be filtered by `start`, `end`, `type` and `min_amount`, and summed
+per day at `/accounts/{id}/transactions/daily`.
+
 ## Transaction
 
 * **Create transactions**.
+* **Create transactions in batch** (JSON array or NDJSON stream).
 """,
     openapi_tags=tags_metadata,
     redoc_url=None,
@@ -60,6 +67,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, PREV_CURSOR_HEADER],
 )
 
 app.include_router(auth.router, tags=["auth"])
@@ -18,4 +18,6 @@ transactions = sa.Table(
     sa.Column("type", sa.Enum(TransactionType, name="transaction_types"), nullable=False),
     sa.Column("amount", sa.Numeric(10, 2), nullable=False),
     sa.Column("timestamp", sa.TIMESTAMP(timezone=True), default=sa.func.now()),
+    # Per-account history in time order: equality on account_id, range and sort on (timestamp, id).
+    sa.Index("ix_transactions_account_id_timestamp_id", "account_id", "timestamp", "id"),
 )
@@ -0,0 +1,31 @@
+from dataclasses import dataclass
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Self
+
+CENT = Decimal("0.01")
+
+
+@dataclass(frozen=True, slots=True, order=True)
+class Money:
+    """Fixed-point amount stored as integer cents."""
+
+    cents: int = 0
+
+    @classmethod
+    def of(cls, amount: Decimal | float | int | str) -> Self:
+        return cls(int(Decimal(str(amount)).quantize(CENT, rounding=ROUND_HALF_UP) * 100))
+
+    def __add__(self, other: Self) -> Self:
+        return Money(self.cents + other.cents)
+
+    def __sub__(self, other: Self) -> Self:
+        return Money(self.cents - other.cents)
+
+    def __neg__(self) -> Self:
+        return Money(-self.cents)
+
+    def is_negative(self) -> bool:
+        return self.cents < 0
+
+    def to_decimal(self) -> Decimal:
+        return Decimal(self.cents).scaleb(-2)
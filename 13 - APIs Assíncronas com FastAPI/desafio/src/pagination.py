@@ -0,0 +1,57 @@
+import base64
+import json
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Self
+
+from databases.interfaces import Record
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+PREV_CURSOR_HEADER = "X-Prev-Cursor"
+
+
+@dataclass(frozen=True, slots=True)
+class Cursor:
+    """Keyset position: the page holds the rows right after (or, if `backwards`, right before) `id`."""
+
+    id: int
+    backwards: bool = False
+
+    def encode(self) -> str:
+        payload = json.dumps({"id": self.id, "b": self.backwards}, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(payload).rstrip(b"=").decode()
+
+    @classmethod
+    def decode(cls, token: str) -> Self:
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+            return cls(id=int(payload["id"]), backwards=bool(payload["b"]))
+        except (ValueError, KeyError, TypeError) as exc:
+            raise ValueError("Invalid cursor.") from exc
+
+
+def resolve_keyset(after_id: int | None, before_id: int | None, cursor: str | None) -> tuple[int | None, int | None]:
+    """Combine the explicit after_id/before_id parameters and the opaque cursor into one keyset bound."""
+    if sum(value is not None for value in (after_id, before_id, cursor)) > 1:
+        raise ValueError("Use only one of after_id, before_id or cursor.")
+    if cursor is not None:
+        position = Cursor.decode(cursor)
+        return (None, position.id) if position.backwards else (position.id, None)
+    return after_id, before_id
+
+
+def cursor_headers(rows: Sequence[Record], limit: int, paged: bool, backwards: bool) -> dict[str, str]:
+    """
+    Cursors for the pages around `rows`, which are in page order. `paged` tells whether
+    the request started past the first row; `backwards` whether it paged with before_id.
+    """
+    if not rows:
+        return {}
+
+    headers = {}
+    full = len(rows) == limit
+    if full or backwards:
+        headers[NEXT_CURSOR_HEADER] = Cursor(rows[-1].id).encode()
+    if paged and not backwards or backwards and full:
+        headers[PREV_CURSOR_HEADER] = Cursor(rows[0].id, backwards=True).encode()
+    return headers
@@ -2,16 +2,27 @@ from databases.interfaces import Record
 
 from src.database import database
 from src.models.account import accounts
+from src.money import Money
 from src.schemas.account import AccountIn
 
 
 class AccountService:
-    async def read_all(self, limit: int, skip: int = 0) -> list[Record]:
-        query = accounts.select().limit(limit).offset(skip)
+    async def read_all(
+        self, limit: int, skip: int = 0, after_id: int | None = None, before_id: int | None = None
+    ) -> list[Record]:
+        query = accounts.select()
+        if before_id is not None:
+            # Walk the primary key backwards from the bound, then restore ascending order.
+            query = query.where(accounts.c.id < before_id).order_by(accounts.c.id.desc()).limit(limit)
+            return list(reversed(await database.fetch_all(query)))
+
+        if after_id is not None:
+            query = query.where(accounts.c.id > after_id)
+        query = query.order_by(accounts.c.id).limit(limit).offset(skip)
         return await database.fetch_all(query)
 
     async def create(self, account: AccountIn) -> Record:
-        command = accounts.insert().values(user_id=account.user_id, balance=account.balance)
+        command = accounts.insert().values(user_id=account.user_id, balance=Money.of(account.balance).to_decimal())
         account_id = await database.execute(command)
 
         query = accounts.select().where(accounts.c.id == account_id)
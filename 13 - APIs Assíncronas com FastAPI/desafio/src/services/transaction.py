@@ -1,47 +1,221 @@
+from datetime import datetime
+
+import sqlalchemy as sa
 from databases.interfaces import Record
 
 from src.database import database
 from src.exceptions import AccountNotFoundError, BusinessError
 from src.models.account import accounts
 from src.models.transaction import TransactionType, transactions
+from src.money import Money
 from src.schemas.transaction import TransactionIn
 
 
+def _history_conditions(
+    account_id: int,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    type_: TransactionType | None = None,
+    min_amount: Money | None = None,
+) -> list[sa.ColumnElement[bool]]:
+    # account_id and the [start, end) range are served by the history index; type and
+    # amount are checked on the rows it yields, still inside the database.
+    conditions = [transactions.c.account_id == account_id]
+    if start is not None:
+        conditions.append(transactions.c.timestamp >= start)
+    if end is not None:
+        conditions.append(transactions.c.timestamp < end)
+    if type_ is not None:
+        conditions.append(transactions.c.type == type_)
+    if min_amount is not None:
+        conditions.append(transactions.c.amount >= min_amount.to_decimal())
+    return conditions
+
+
+def history_query(
+    account_id: int,
+    limit: int,
+    skip: int = 0,
+    after_id: int | None = None,
+    before_id: int | None = None,
+    *,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    type_: TransactionType | None = None,
+    min_amount: Money | None = None,
+) -> sa.Select:
+    """
+    Page of an account's history in (timestamp, id) order, served by the
+    ix_transactions_account_id_timestamp_id index: account_id equality, then a
+    range on timestamp for [start, end) and on (timestamp, id) for the keyset.
+    With before_id the rows come in descending order and must be reversed.
+    """
+    key = sa.tuple_(transactions.c.timestamp, transactions.c.id)
+    query = transactions.select().where(*_history_conditions(account_id, start, end, type_, min_amount))
+
+    if before_id is not None:
+        query = query.where(key < _history_position(before_id))
+        return query.order_by(transactions.c.timestamp.desc(), transactions.c.id.desc()).limit(limit)
+
+    if after_id is not None:
+        query = query.where(key > _history_position(after_id))
+    return query.order_by(transactions.c.timestamp, transactions.c.id).limit(limit).offset(skip)
+
+
+def daily_totals_query(
+    account_id: int,
+    *,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    type_: TransactionType | None = None,
+    min_amount: Money | None = None,
+) -> sa.Select:
+    """Deposited and withdrawn sums and counts per day of the filtered history, in day order."""
+    day = sa.func.date(transactions.c.timestamp)
+    is_deposit = transactions.c.type == TransactionType.DEPOSIT
+    is_withdrawal = transactions.c.type == TransactionType.WITHDRAWAL
+
+    def total(condition: sa.ColumnElement[bool]) -> sa.ColumnElement:
+        # Rounded in SQL: backends that keep the amounts as floating point return
+        # sums with spurious fractional digits.
+        return sa.func.round(sa.func.coalesce(sa.func.sum(sa.case((condition, transactions.c.amount))), 0), 2)
+
+    return (
+        sa.select(
+            day.label("day"),
+            total(is_deposit).label("deposits"),
+            total(is_withdrawal).label("withdrawals"),
+            sa.func.count(sa.case((is_deposit, transactions.c.id))).label("deposit_count"),
+            sa.func.count(sa.case((is_withdrawal, transactions.c.id))).label("withdrawal_count"),
+        )
+        .where(*_history_conditions(account_id, start, end, type_, min_amount))
+        .group_by(day)
+        .order_by(day)
+    )
+
+
+def _history_position(transaction_id: int) -> sa.Tuple:
+    # The bound timestamp is read by the database itself, so it compares exactly
+    # with the stored values whatever the backend's datetime representation.
+    timestamp = sa.select(transactions.c.timestamp).where(transactions.c.id == transaction_id).scalar_subquery()
+    return sa.tuple_(timestamp, sa.literal(transaction_id))
+
+
 class TransactionService:
-    async def read_all(self, account_id: int, limit: int, skip: int = 0) -> list[Record]:
-        query = transactions.select().where(transactions.c.account_id == account_id).limit(limit).offset(skip)
+    async def read_all(
+        self,
+        account_id: int,
+        limit: int,
+        skip: int = 0,
+        after_id: int | None = None,
+        before_id: int | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        type_: TransactionType | None = None,
+        min_amount: float | None = None,
+    ) -> list[Record]:
+        query = history_query(
+            account_id,
+            limit,
+            skip,
+            after_id,
+            before_id,
+            start=start,
+            end=end,
+            type_=type_,
+            min_amount=Money.of(min_amount) if min_amount is not None else None,
+        )
+        rows = await database.fetch_all(query)
+        return list(reversed(rows)) if before_id is not None else rows
+
+    async def read_daily_totals(
+        self,
+        account_id: int,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        type_: TransactionType | None = None,
+        min_amount: float | None = None,
+    ) -> list[Record]:
+        query = daily_totals_query(
+            account_id,
+            start=start,
+            end=end,
+            type_=type_,
+            min_amount=Money.of(min_amount) if min_amount is not None else None,
+        )
         return await database.fetch_all(query)
 
     @database.transaction()
     async def create(self, transaction: TransactionIn) -> Record:
-        query = accounts.select().where(accounts.c.id == transaction.account_id)
-        account = await database.fetch_one(query)
-        if not account:
-            raise AccountNotFoundError
-
-        if transaction.type == TransactionType.WITHDRAWAL:
-            balance = float(account.balance) - transaction.amount
-            if balance < 0:
-                raise BusinessError("Operation not carried out due to lack of balance")
-        else:
-            balance = float(account.balance) + transaction.amount
+        amount = Money.of(transaction.amount)
+
+        # Update account balance: the balance check and the write are a single
+        # statement, so concurrent withdrawals cannot overdraw the account.
+        if not await self.__update_account_balance(transaction.account_id, transaction.type, amount):
+            query = accounts.select().with_only_columns(accounts.c.id).where(accounts.c.id == transaction.account_id)
+            if await database.fetch_val(query) is None:
+                raise AccountNotFoundError
+            raise BusinessError("Operation not carried out due to lack of balance")
 
         # Create transaction entry
-        transaction_id = await self.__register_transaction(transaction)
-        # Update account balance
-        await self.__update_account_balance(transaction.account_id, balance)
-
-        query = transactions.select().where(transactions.c.id == transaction_id)
-        return await database.fetch_one(query)
-
-    async def __update_account_balance(self, account_id: int, balance: float) -> None:
-        command = accounts.update().where(accounts.c.id == account_id).values(balance=balance)
-        await database.execute(command)
-
-    async def __register_transaction(self, transaction: TransactionIn) -> int:
-        command = transactions.insert().values(
-            account_id=transaction.account_id,
-            type=transaction.type,
-            amount=transaction.amount,
+        return await self.__register_transaction(transaction, amount)
+
+    @database.transaction()
+    async def create_batch(self, batch: list[TransactionIn]) -> list[str | None]:
+        """Apply a chunk of transactions in input order, returning None or an error detail per item."""
+        # Lock the touched accounts and apply the whole chunk in memory, grouped by account.
+        query = (
+            accounts.select()
+            .with_only_columns(accounts.c.id, accounts.c.balance)
+            .where(accounts.c.id.in_({transaction.account_id for transaction in batch}))
+            .with_for_update()
+        )
+        balances = {account.id: Money.of(account.balance) for account in await database.fetch_all(query)}
+        deltas: dict[int, Money] = {}
+        rows = []
+        results: list[str | None] = []
+
+        for transaction in batch:
+            balance = balances.get(transaction.account_id)
+            if balance is None:
+                results.append("Account not found.")
+                continue
+
+            amount = Money.of(transaction.amount)
+            delta = -amount if transaction.type == TransactionType.WITHDRAWAL else amount
+            if (balance + delta).is_negative():
+                results.append("Operation not carried out due to lack of balance")
+                continue
+
+            balances[transaction.account_id] = balance + delta
+            deltas[transaction.account_id] = deltas.get(transaction.account_id, Money()) + delta
+            rows.append({"account_id": transaction.account_id, "type": transaction.type, "amount": amount.to_decimal()})
+            results.append(None)
+
+        # One UPDATE for every touched account and one multi-row INSERT for the whole chunk.
+        deltas = {account_id: delta for account_id, delta in deltas.items() if delta.cents}
+        if deltas:
+            increments = {account_id: delta.to_decimal() for account_id, delta in deltas.items()}
+            increment = sa.case(increments, value=accounts.c.id)
+            command = accounts.update().where(accounts.c.id.in_(deltas)).values(balance=accounts.c.balance + increment)
+            await database.execute(command)
+        if rows:
+            await database.execute(transactions.insert().values(rows))
+        return results
+
+    async def __update_account_balance(self, account_id: int, type_: TransactionType, amount: Money) -> bool:
+        value = amount.to_decimal()
+        command = accounts.update().where(accounts.c.id == account_id).returning(accounts.c.id)
+        if type_ == TransactionType.WITHDRAWAL:
+            command = command.where(accounts.c.balance >= value).values(balance=accounts.c.balance - value)
+        else:
+            command = command.values(balance=accounts.c.balance + value)
+        return await database.fetch_val(command) is not None
+
+    async def __register_transaction(self, transaction: TransactionIn, amount: Money) -> Record:
+        command = (
+            transactions.insert()
+            .values(account_id=transaction.account_id, type=transaction.type, amount=amount.to_decimal())
+            .returning(*transactions.c)
         )
-        return await database.execute(command)
+        return await database.fetch_one(command)
@@ -1,3 +1,5 @@
+from datetime import date
+
 from pydantic import AwareDatetime, BaseModel, NaiveDatetime, PositiveFloat
 
 
@@ -14,3 +16,11 @@ class TransactionOut(BaseModel):
     type: str
     amount: PositiveFloat
     timestamp: AwareDatetime | NaiveDatetime
+
+
+class DailyTotalOut(BaseModel):
+    day: date
+    deposits: float
+    withdrawals: float
+    deposit_count: int
+    withdrawal_count: int
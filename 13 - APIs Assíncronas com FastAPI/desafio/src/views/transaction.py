@@ -7,3 +7,9 @@ class TransactionOut(BaseModel):
     type: str
     amount: PositiveFloat
     timestamp: AwareDatetime | NaiveDatetime
+
+
+class TransactionResultOut(BaseModel):
+    index: int
+    status: str
+    detail: str | list | None = None
@@ -0,0 +1,160 @@
+from datetime import datetime
+
+import pytest_asyncio
+from fastapi import status
+from httpx import AsyncClient
+
+HISTORY = [
+    ("deposit", 100, datetime(2024, 1, 1, 9)),
+    ("withdrawal", 20, datetime(2024, 1, 1, 15)),
+    ("deposit", 5.5, datetime(2024, 1, 2, 10)),
+    ("withdrawal", 40, datetime(2024, 1, 2, 11)),
+    ("withdrawal", 10, datetime(2024, 1, 2, 12)),
+    ("deposit", 300, datetime(2024, 1, 4, 8)),
+]
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def populate_history(db):
+    from src.database import database
+    from src.models.transaction import TransactionType, transactions
+    from src.schemas.account import AccountIn
+    from src.services.account import AccountService
+
+    service = AccountService()
+    await service.create(AccountIn(user_id=1, balance=1000))
+    await service.create(AccountIn(user_id=2, balance=1000))
+    rows = [
+        {"account_id": 1, "type": TransactionType(type_), "amount": amount, "timestamp": timestamp}
+        for type_, amount, timestamp in HISTORY
+    ]
+    rows.append({"account_id": 2, "type": TransactionType.DEPOSIT, "amount": 1, "timestamp": datetime(2024, 1, 1)})
+    await database.execute(transactions.insert().values(rows))
+
+
+async def _read(client: AsyncClient, headers: dict, **params) -> list[dict]:
+    response = await client.get("/accounts/1/transactions", params={"limit": 10, **params}, headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+    return response.json()
+
+
+async def test_read_account_transactions_success(client: AsyncClient, headers: dict):
+    # When
+    content = await _read(client, headers)
+
+    # Then
+    assert [(item["type"], item["amount"]) for item in content] == [(type_, amount) for type_, amount, _ in HISTORY]
+
+
+async def test_read_account_transactions_time_range_success(client: AsyncClient, headers: dict):
+    # When
+    content = await _read(client, headers, start="2024-01-01T12:00:00", end="2024-01-02T12:00:00")
+
+    # Then
+    assert [item["amount"] for item in content] == [20, 5.5, 40]
+
+
+async def test_read_account_transactions_type_success(client: AsyncClient, headers: dict):
+    # When
+    deposits = await _read(client, headers, type="deposit")
+    withdrawals = await _read(client, headers, type="withdrawal")
+
+    # Then
+    assert [item["amount"] for item in deposits] == [100, 5.5, 300]
+    assert [item["amount"] for item in withdrawals] == [20, 40, 10]
+
+
+async def test_read_account_transactions_min_amount_success(client: AsyncClient, headers: dict):
+    # When
+    content = await _read(client, headers, min_amount=20)
+
+    # Then
+    assert [item["amount"] for item in content] == [100, 20, 40, 300]
+
+
+async def test_read_account_transactions_combined_filters_success(client: AsyncClient, headers: dict):
+    # When
+    content = await _read(client, headers, start="2024-01-02T00:00:00", type="withdrawal", min_amount=15)
+
+    # Then
+    assert [item["amount"] for item in content] == [40]
+
+
+async def test_read_account_transactions_invalid_filters_fail(client: AsyncClient, headers: dict):
+    # When
+    invalid_type = await client.get("/accounts/1/transactions", params={"limit": 10, "type": "fee"}, headers=headers)
+    invalid_amount = await client.get(
+        "/accounts/1/transactions", params={"limit": 10, "min_amount": 0}, headers=headers
+    )
+
+    # Then
+    assert invalid_type.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert invalid_amount.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+async def test_read_account_transactions_cursor_round_trip_success(client: AsyncClient, headers: dict):
+    # Given
+    url = "/accounts/1/transactions"
+    first = await client.get(url, params={"limit": 4}, headers=headers)
+
+    # When
+    second = await client.get(url, params={"limit": 4, "cursor": first.headers["X-Next-Cursor"]}, headers=headers)
+    previous = await client.get(url, params={"limit": 4, "cursor": second.headers["X-Prev-Cursor"]}, headers=headers)
+
+    # Then
+    assert [item["amount"] for item in second.json()] == [10, 300]
+    assert "X-Next-Cursor" not in second.headers
+    assert previous.json() == first.json()
+
+
+async def test_read_account_transactions_cursor_with_filters_success(client: AsyncClient, headers: dict):
+    # Given
+    params = {"limit": 1, "type": "withdrawal"}
+    amounts = []
+
+    # When
+    response = await client.get("/accounts/1/transactions", params=params, headers=headers)
+    amounts += [item["amount"] for item in response.json()]
+    while "X-Next-Cursor" in response.headers:
+        params["cursor"] = response.headers["X-Next-Cursor"]
+        response = await client.get("/accounts/1/transactions", params=params, headers=headers)
+        amounts += [item["amount"] for item in response.json()]
+
+    # Then
+    assert amounts == [20, 40, 10]
+
+
+async def test_read_account_transactions_invalid_cursor_fail(client: AsyncClient, headers: dict):
+    # When
+    response = await client.get("/accounts/1/transactions", params={"limit": 2, "cursor": "e30"}, headers=headers)
+
+    # Then
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json() == {"detail": "Invalid cursor."}
+
+
+async def test_read_account_daily_totals_success(client: AsyncClient, headers: dict):
+    # When
+    response = await client.get("/accounts/1/transactions/daily", headers=headers)
+
+    # Then
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == [
+        {"day": "2024-01-01", "deposits": 100, "withdrawals": 20, "deposit_count": 1, "withdrawal_count": 1},
+        {"day": "2024-01-02", "deposits": 5.5, "withdrawals": 50, "deposit_count": 1, "withdrawal_count": 2},
+        {"day": "2024-01-04", "deposits": 300, "withdrawals": 0, "deposit_count": 1, "withdrawal_count": 0},
+    ]
+
+
+async def test_read_account_daily_totals_with_filters_success(client: AsyncClient, headers: dict):
+    # Given
+    params = {"start": "2024-01-02T00:00:00", "type": "withdrawal", "min_amount": 15}
+
+    # When
+    response = await client.get("/accounts/1/transactions/daily", params=params, headers=headers)
+
+    # Then
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == [
+        {"day": "2024-01-02", "deposits": 0, "withdrawals": 40, "deposit_count": 0, "withdrawal_count": 1},
+    ]
@@ -0,0 +1,80 @@
+import pytest_asyncio
+from fastapi import status
+from httpx import AsyncClient
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def populate_accounts(db):
+    from src.schemas.account import AccountIn
+    from src.services.account import AccountService
+
+    service = AccountService()
+    for user_id in range(1, 6):
+        await service.create(AccountIn(user_id=user_id, balance=100))
+
+
+async def test_read_accounts_follows_next_cursor_success(client: AsyncClient, headers: dict):
+    # Given
+    params = {"limit": 2}
+    pages = []
+
+    # When
+    response = await client.get("/accounts/", params=params, headers=headers)
+    pages.append([account["id"] for account in response.json()])
+    while "X-Next-Cursor" in response.headers:
+        params = {"limit": 2, "cursor": response.headers["X-Next-Cursor"]}
+        response = await client.get("/accounts/", params=params, headers=headers)
+        pages.append([account["id"] for account in response.json()])
+
+    # Then
+    assert response.status_code == status.HTTP_200_OK
+    assert pages == [[1, 2], [3, 4], [5]]
+
+
+async def test_read_accounts_prev_cursor_returns_previous_page_success(client: AsyncClient, headers: dict):
+    # Given
+    first = await client.get("/accounts/", params={"limit": 2}, headers=headers)
+    second = await client.get(
+        "/accounts/", params={"limit": 2, "cursor": first.headers["X-Next-Cursor"]}, headers=headers
+    )
+
+    # When
+    response = await client.get(
+        "/accounts/", params={"limit": 2, "cursor": second.headers["X-Prev-Cursor"]}, headers=headers
+    )
+
+    # Then
+    assert response.status_code == status.HTTP_200_OK
+    assert [account["id"] for account in response.json()] == [1, 2]
+    assert "X-Prev-Cursor" not in first.headers
+    assert "X-Next-Cursor" in response.headers
+
+
+async def test_read_accounts_after_and_before_id_success(client: AsyncClient, headers: dict):
+    # When
+    after = await client.get("/accounts/", params={"limit": 2, "after_id": 2}, headers=headers)
+    before = await client.get("/accounts/", params={"limit": 2, "before_id": 5}, headers=headers)
+
+    # Then
+    assert [account["id"] for account in after.json()] == [3, 4]
+    assert [account["id"] for account in before.json()] == [3, 4]
+
+
+async def test_read_accounts_invalid_cursor_fail(client: AsyncClient, headers: dict):
+    # When
+    response = await client.get("/accounts/", params={"limit": 2, "cursor": "not-a-cursor"}, headers=headers)
+
+    # Then
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+async def test_read_accounts_cursor_and_after_id_fail(client: AsyncClient, headers: dict):
+    # Given
+    first = await client.get("/accounts/", params={"limit": 2}, headers=headers)
+    params = {"limit": 2, "after_id": 1, "cursor": first.headers["X-Next-Cursor"]}
+
+    # When
+    response = await client.get("/accounts/", params=params, headers=headers)
+
+    # Then
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
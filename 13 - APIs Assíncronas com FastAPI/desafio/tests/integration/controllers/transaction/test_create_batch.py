@@ -0,0 +1,88 @@
+import json
+
+import pytest_asyncio
+from fastapi import status
+from httpx import AsyncClient
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def populate_accounts(db):
+    from src.schemas.account import AccountIn
+    from src.services.account import AccountService
+
+    service = AccountService()
+    await service.create(AccountIn(user_id=1, balance=100))
+    await service.create(AccountIn(user_id=2, balance=50))
+
+
+async def _balances(client: AsyncClient, headers: dict) -> dict[int, float]:
+    response = await client.get("/accounts/", params={"limit": 10}, headers=headers)
+    return {account["id"]: account["balance"] for account in response.json()}
+
+
+async def test_create_batch_json_array_success(client: AsyncClient, headers: dict):
+    # Given
+    data = [
+        {"account_id": 1, "type": "withdrawal", "amount": 30},
+        {"account_id": 2, "type": "withdrawal", "amount": 80},
+        {"account_id": 3, "type": "deposit", "amount": 10},
+        {"account_id": 1, "type": "deposit", "amount": -5},
+        {"account_id": 2, "type": "deposit", "amount": 25.5},
+        {"account_id": 1, "type": "withdrawal", "amount": 70},
+    ]
+
+    # When
+    response = await client.post("/transactions/batch", json=data, headers=headers)
+
+    # Then
+    content = response.json()
+    assert response.status_code == status.HTTP_200_OK
+    assert [item["index"] for item in content] == list(range(len(data)))
+    assert [item["status"] for item in content] == ["created", "rejected", "rejected", "invalid", "created", "created"]
+    assert content[1]["detail"] == "Operation not carried out due to lack of balance"
+    assert content[2]["detail"] == "Account not found."
+    assert content[3]["detail"][0]["loc"] == ["amount"]
+    assert await _balances(client, headers) == {1: 0, 2: 75.5}
+
+
+async def test_create_batch_ndjson_success(client: AsyncClient, headers: dict):
+    # Given
+    lines = [
+        json.dumps({"account_id": 1, "type": "deposit", "amount": 10}),
+        '{"account_id": 1, "type": ',
+        json.dumps({"account_id": 2, "type": "withdrawal", "amount": 60}),
+        json.dumps({"account_id": 2, "type": "withdrawal", "amount": 50}),
+    ]
+    content_type = {"Content-Type": "application/x-ndjson"}
+
+    # When
+    response = await client.post(
+        "/transactions/batch", content="\n".join(lines) + "\n", headers=headers | content_type
+    )
+
+    # Then
+    content = response.json()
+    assert response.status_code == status.HTTP_200_OK
+    assert [item["status"] for item in content] == ["created", "invalid", "rejected", "created"]
+    assert await _balances(client, headers) == {1: 110, 2: 0}
+
+
+async def test_create_batch_not_an_array_fail(client: AsyncClient, headers: dict):
+    # Given
+    data = {"account_id": 1, "type": "deposit", "amount": 10}
+
+    # When
+    response = await client.post("/transactions/batch", json=data, headers=headers)
+
+    # Then
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json() == {"detail": "Expected a JSON array."}
+    assert await _balances(client, headers) == {1: 100, 2: 50}
+
+
+async def test_create_batch_not_authenticated_fail(client: AsyncClient):
+    # When
+    response = await client.post("/transactions/batch", json=[])
+
+    # Then
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED